@@ -1,33 +1,157 @@
 import asyncio
+import json
 import logging
+import os
+import threading
+import time
 import traceback
+from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import Optional, Union, List, Any, Dict
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, model_validator
+from typing import Callable, Optional, Set, Union, List, Any, Dict
 
+from browser_contexts import SharedBrowser
+from coalesce import ScrapeCoalescer
+from driver_pool import DriverPool, DriverPoolBusy
+from jobs import JobStore, ScrapeJob
+from network import network_totals
+from result_cache import ResultCache
+from review_store import ReviewStore
 from scraper_engine import (
     scrape_all_business_reviews,
     scrape_competitor_reviews,
-    get_driver,
     probe_maps_search,
     probe_place_reviews,
+    page_state_counts,
+    reviews_entry_counts,
+    scrape_market_census,
+    selector_stats,
 )
+from stage_timeouts import stage_timeouts
 
 logging.basicConfig(level=logging.INFO)
 log = logging.getLogger("leadgap.scraper")
 
-app = FastAPI()
+# BROWSER_MODE=contexts serves every job from one Chromium, one browser context each.
+DRIVER_POOL: Union[DriverPool, SharedBrowser] = (
+    SharedBrowser.from_env()
+    if os.environ.get("BROWSER_MODE", "pool") == "contexts"
+    else DriverPool.from_env()
+)
+JOBS = JobStore(ttl_sec=float(os.environ.get("JOB_TTL_SEC", "3600")))
+# Jobs are not bound to the proxy timeout, so they get their own (deeper) budget.
+JOB_SCRAPE_BUDGET_SEC = float(os.environ.get("JOB_SCRAPE_BUDGET_SEC", "600"))
+JOB_CHECKOUT_TIMEOUT_SEC = float(os.environ.get("JOB_CHECKOUT_TIMEOUT_SEC", "600"))
+# Queued jobs wait for a browser on the event loop, not in executor threads that
+# /scrape and the probes also need; only a job holding a slot calls to_thread.
+JOB_QUEUE_MAX = int(os.environ.get("JOB_QUEUE_MAX", "50"))
+JOB_CONCURRENCY = DRIVER_POOL.max_contexts if isinstance(DRIVER_POOL, SharedBrowser) else DRIVER_POOL.size
+_job_slots = asyncio.Semaphore(JOB_CONCURRENCY)
+_jobs_waiting = 0
+COALESCER = ScrapeCoalescer()
+RESULT_CACHE = ResultCache.from_env()
+REVIEW_STORE = ReviewStore.from_env()
+_background_tasks: Set[asyncio.Task] = set()
+# max_businesses when a request leaves it out.
+NICHE_MAX_BUSINESSES = 3
+CENSUS_MAX_BUSINESSES = 60
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # Warm in the background so the health check answers while Chromium boots.
+    threading.Thread(target=DRIVER_POOL.warm, name="driver-pool-warm", daemon=True).start()
+    DRIVER_POOL.start_watchdog()
+    yield
+    DRIVER_POOL.close()
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 class ScrapeRequest(BaseModel):
     query: str
     mode: str = "niche"
     location: Optional[str] = None
-    max_businesses: int = 3
+    # Omitted: 3 places for niche scrapes, a whole census page (60) for census mode.
+    max_businesses: Optional[int] = None
     reviews_per_business: int = 10
     min_stars: int = 1
     max_stars: int = 5
+    # Competitor mode: only fetch reviews newer than the ones already stored for the place.
+    incremental: bool = False
+    # Scroll each place for up to reviews_per_business reviews (capped by DEEP_MAX_REVIEWS)
+    # instead of returning at most 20; since_days stops at reviews older than that.
+    deep: bool = False
+    since_days: Optional[int] = None
+    # Census mode: open this many of the listed places to read their star histogram.
+    histograms: int = 0
+
+    @model_validator(mode="after")
+    def _default_max_businesses(self) -> "ScrapeRequest":
+        # Resolved here so the cache and coalescer always compare a concrete limit.
+        if self.max_businesses is None:
+            self.max_businesses = CENSUS_MAX_BUSINESSES if self.mode == "census" else NICHE_MAX_BUSINESSES
+        return self
+
+
+def _run_pooled(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run an engine call on a driver checked out of the warm pool."""
+    with DRIVER_POOL.lease() as driver:
+        return fn(*args, driver=driver, **kwargs)
+
+
+def _scrape_call(request: ScrapeRequest, driver=None, **engine_kwargs: Any) -> Union[List[Any], Dict[str, Any]]:
+    """Dispatch a ScrapeRequest to the matching engine entry point."""
+    if request.mode == "census":
+        return scrape_market_census(
+            request.query,
+            request.location,
+            request.max_businesses,
+            driver=driver,
+            histograms=request.histograms,
+            **engine_kwargs,
+        )
+    if request.mode == "competitor":
+        return scrape_competitor_reviews(
+            request.query,
+            request.location,
+            request.reviews_per_business,
+            request.min_stars,
+            request.max_stars,
+            driver=driver,
+            review_store=REVIEW_STORE if request.incremental else None,
+            deep=request.deep,
+            since_days=request.since_days,
+            **engine_kwargs,
+        )
+    return scrape_all_business_reviews(
+        request.query,
+        request.location,
+        request.max_businesses,
+        request.reviews_per_business,
+        request.min_stars,
+        request.max_stars,
+        driver=driver,
+        deep=request.deep,
+        since_days=request.since_days,
+        **engine_kwargs,
+    )
+
+
+def _validate_scrape(request: ScrapeRequest) -> None:
+    if request.mode == "competitor" and not request.location:
+        raise HTTPException(status_code=400, detail="Location is required for competitor mode")
+
+
+def _busy_error(e: DriverPoolBusy) -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail=f"Scraper busy: {e.reason}",
+        headers={"Retry-After": str(e.retry_after)},
+    )
 
 
 @app.get("/")
@@ -35,24 +159,39 @@ def health_check():
     return {"status": "alive", "service": "LeadGap Scraper Engine"}
 
 
+@app.get("/stats")
+def stats():
+    """Driver pool and job state for dashboards and load tuning."""
+    return {
+        "pool": DRIVER_POOL.stats(),
+        "jobs": dict(JOBS.counts(), waiting_for_slot=_jobs_waiting),
+        "coalescing": COALESCER.stats(),
+        "cache": RESULT_CACHE.stats(),
+        "page_states": page_state_counts(),
+        "reviews_entry": reviews_entry_counts(),
+        "selectors": selector_stats(),
+        "stage_timeouts": stage_timeouts(),
+        "network": network_totals(),
+    }
+
+
 @app.get("/diagnostics")
 def diagnostics():
     """Quick Chrome/Chromium smoke test — use after deploy to verify Selenium works."""
-    driver = None
     try:
-        driver = get_driver()
-        driver.get("about:blank")
-        return {
-            "ok": True,
-            "title": driver.title,
-            "chrome_bin": driver.capabilities.get("browserName"),
-        }
+        with DRIVER_POOL.lease() as driver:
+            driver.get("about:blank")
+            return {
+                "ok": True,
+                "title": driver.title,
+                "chrome_bin": driver.capabilities.get("browserName"),
+                "pool": DRIVER_POOL.stats(),
+            }
+    except DriverPoolBusy as e:
+        raise _busy_error(e)
     except Exception as e:
         log.error("diagnostics failed: %s\n%s", e, traceback.format_exc())
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        if driver:
-            driver.quit()
 
 
 @app.post("/probe")
@@ -60,10 +199,13 @@ async def run_probe(request: ScrapeRequest):
     """Debug Maps search without extracting reviews."""
     try:
         return await asyncio.to_thread(
+            _run_pooled,
             probe_maps_search,
             request.query,
             request.location,
         )
+    except DriverPoolBusy as e:
+        raise _busy_error(e)
     except Exception as e:
         log.error("probe failed: %s\n%s", e, traceback.format_exc())
         raise HTTPException(status_code=500, detail=str(e))
@@ -74,17 +216,20 @@ async def run_probe_reviews(request: ScrapeRequest):
     """Open first listing and sample review extraction."""
     try:
         return await asyncio.to_thread(
+            _run_pooled,
             probe_place_reviews,
             request.query,
             request.location,
         )
+    except DriverPoolBusy as e:
+        raise _busy_error(e)
     except Exception as e:
         log.error("probe-reviews failed: %s\n%s", e, traceback.format_exc())
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/scrape")
-async def run_scrape(request: ScrapeRequest):
+async def run_scrape(request: ScrapeRequest, response: Response):
     log.info(
         "scrape start mode=%s query=%s location=%s",
         request.mode,
@@ -92,38 +237,177 @@ async def run_scrape(request: ScrapeRequest):
         request.location,
     )
     try:
-        if request.mode == "competitor":
-            if not request.location:
-                raise HTTPException(status_code=400, detail="Location is required for competitor mode")
-
-            data: Union[List[Any], Dict[str, Any]] = await asyncio.to_thread(
-                scrape_competitor_reviews,
-                request.query,
-                request.location,
-                request.reviews_per_business,
-                request.min_stars,
-                request.max_stars,
-            )
-        else:
-            data = await asyncio.to_thread(
-                scrape_all_business_reviews,
-                request.query,
-                request.location,
-                request.max_businesses,
-                request.reviews_per_business,
-                request.min_stars,
-                request.max_stars,
-            )
-
-        log.info("scrape done mode=%s payload_type=%s", request.mode, type(data).__name__)
+        _validate_scrape(request)
+        # Incremental scrapes are already cheap and must see new reviews, so skip the cache.
+        cached = None if request.incremental else RESULT_CACHE.get(request)
+        if cached is not None:
+            data, age = cached
+            response.headers["X-Cache"] = "HIT"
+            response.headers["X-Cache-Age"] = str(int(age))
+            log.info("scrape cache hit mode=%s query=%s age=%ds", request.mode, request.query, age)
+            return data
+
+        report: Dict[str, Any] = {}
+        data, shared = await COALESCER.run(
+            request,
+            lambda: asyncio.to_thread(_run_pooled, _scrape_call, request, report=report),
+        )
+        if not shared and not request.incremental:
+            RESULT_CACHE.put(request, data)
+        response.headers["X-Cache"] = "BYPASS" if request.incremental else "MISS"
+        response.headers["X-Cache-Age"] = "0"
+        response.headers["X-Coalesced"] = "1" if shared else "0"
+        if report:
+            # Niche results must stay a bare JSON list, so per-scrape stats ride in a header.
+            response.headers["X-Scrape-Report"] = json.dumps(report, separators=(",", ":"))
+
+        log.info(
+            "scrape done mode=%s payload_type=%s coalesced=%s",
+            request.mode,
+            type(data).__name__,
+            shared,
+        )
         return data
     except HTTPException:
         raise
+    except DriverPoolBusy as e:
+        raise _busy_error(e)
     except Exception as e:
         log.error("scrape failed: %s\n%s", e, traceback.format_exc())
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _result_count(data: Union[List[Any], Dict[str, Any]]) -> int:
+    if isinstance(data, dict):
+        return len(data.get("reviews") or [])
+    return len(data)
+
+
+def _encode_frame(frame: Dict[str, Any], sse: bool) -> str:
+    payload = json.dumps(frame, ensure_ascii=False)
+    if sse:
+        return f"event: {frame['type']}\ndata: {payload}\n\n"
+    return payload + "\n"
+
+
+@app.post("/scrape/stream")
+async def run_scrape_stream(request: ScrapeRequest, http_request: Request):
+    """Like /scrape, but emits each business's rows as NDJSON (or SSE) frames as they land."""
+    _validate_scrape(request)
+    pressure = DRIVER_POOL.memory_pressure()
+    if pressure:
+        raise _busy_error(DriverPoolBusy(pressure, retry_after=15))
+
+    sse = "text/event-stream" in http_request.headers.get("accept", "")
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    def on_rows(business_name: str, rows: List[dict]) -> None:
+        frame = {"type": "rows", "business_name": business_name, "rows": rows}
+        loop.call_soon_threadsafe(queue.put_nowait, frame)
+
+    async def produce() -> None:
+        try:
+            report: Dict[str, Any] = {}
+            data = await asyncio.to_thread(_run_pooled, _scrape_call, request, on_rows=on_rows, report=report)
+            frame: Dict[str, Any] = {"type": "summary", "count": _result_count(data), "result": data, "report": report}
+            log.info("scrape stream done mode=%s count=%s", request.mode, frame["count"])
+        except DriverPoolBusy as e:
+            frame = {"type": "error", "status": 503, "detail": f"Scraper busy: {e.reason}", "retry_after": e.retry_after}
+        except Exception as e:
+            log.error("scrape stream failed: %s\n%s", e, traceback.format_exc())
+            frame = {"type": "error", "status": 500, "detail": str(e)}
+        await queue.put(frame)
+        await queue.put(None)
+
+    async def frames():
+        # The scrape thread runs to completion even if the client goes away.
+        task = asyncio.create_task(produce())
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+        while True:
+            frame = await queue.get()
+            if frame is None:
+                return
+            yield _encode_frame(frame, sse)
+
+    log.info("scrape stream start mode=%s query=%s sse=%s", request.mode, request.query, sse)
+    return StreamingResponse(
+        frames(),
+        media_type="text/event-stream" if sse else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _run_job_sync(job: ScrapeJob, request: ScrapeRequest, checkout_sec: float) -> Union[List[Any], Dict[str, Any]]:
+    with DRIVER_POOL.lease(timeout=checkout_sec) as driver:
+        job.mark_running()
+        return _scrape_call(
+            request,
+            driver=driver,
+            budget_sec=JOB_SCRAPE_BUDGET_SEC,
+            on_rows=job.add_rows,
+            report=job.report,
+        )
+
+
+async def _acquire_job_slot(timeout: float) -> None:
+    global _jobs_waiting
+    try:
+        await asyncio.wait_for(_job_slots.acquire(), timeout)
+    except asyncio.TimeoutError:
+        raise DriverPoolBusy("all browsers are busy")
+    finally:
+        _jobs_waiting -= 1
+
+
+async def _run_job(job: ScrapeJob, request: ScrapeRequest) -> None:
+    queued_at = time.monotonic()
+    try:
+        await _acquire_job_slot(JOB_CHECKOUT_TIMEOUT_SEC)
+        try:
+            # /scrape calls share the pool, so the lease may still wait briefly.
+            checkout_sec = max(1.0, queued_at + JOB_CHECKOUT_TIMEOUT_SEC - time.monotonic())
+            data = await asyncio.to_thread(_run_job_sync, job, request, checkout_sec)
+        finally:
+            _job_slots.release()
+        job.finish(data)
+        log.info("job %s done mode=%s", job.id, request.mode)
+    except DriverPoolBusy as e:
+        job.fail(f"Scraper busy: {e.reason}")
+    except Exception as e:
+        log.error("job %s failed: %s\n%s", job.id, e, traceback.format_exc())
+        job.fail(str(e))
+
+
+@app.post("/jobs", status_code=202)
+async def create_job(request: ScrapeRequest):
+    """Start a scrape in the background; poll GET /jobs/{id} for rows and the result."""
+    global _jobs_waiting
+    _validate_scrape(request)
+    pressure = DRIVER_POOL.memory_pressure()
+    if pressure:
+        raise _busy_error(DriverPoolBusy(pressure, retry_after=15))
+    if _jobs_waiting >= JOB_QUEUE_MAX:
+        raise _busy_error(DriverPoolBusy("job queue is full", retry_after=30))
+
+    _jobs_waiting += 1
+    job = JOBS.create(request.model_dump())
+    task = asyncio.create_task(_run_job(job, request))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    log.info("job %s queued mode=%s query=%s", job.id, request.mode, request.query)
+    return {"job_id": job.id, "status": job.status, "status_url": f"/jobs/{job.id}"}
+
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str):
+    job = JOBS.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown job id")
+    return job.snapshot()
+
+
 if __name__ == "__main__":
     import uvicorn
 
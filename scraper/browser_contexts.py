@@ -0,0 +1,279 @@
+import json
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+import websocket  # websocket-client, installed with selenium
+
+from driver_pool import DriverPoolBusy
+from consent import preload_consent
+from memory_watch import container_memory, memory_pressure, process_tree_rss
+from network import apply_network_policy
+from scraper_engine import CHROME_ARGUMENTS, attach_driver, chrome_binary
+
+log = logging.getLogger("leadgap.scraper.contexts")
+
+
+class _BrowserCdp:
+    """Browser-level DevTools connection for the Target.* calls chromedriver doesn't expose."""
+
+    def __init__(self, ws_url: str):
+        # Chromium rejects unknown Origin headers on the DevTools socket.
+        self._ws = websocket.create_connection(ws_url, timeout=30, suppress_origin=True)
+        self._lock = threading.Lock()
+        self._next_id = 0
+
+    def call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        with self._lock:
+            self._next_id += 1
+            msg_id = self._next_id
+            self._ws.send(json.dumps({"id": msg_id, "method": method, "params": params or {}}))
+            while True:
+                msg = json.loads(self._ws.recv())
+                if msg.get("id") != msg_id:
+                    continue  # events and stale replies
+                if "error" in msg:
+                    raise RuntimeError(f"{method}: {msg['error'].get('message')}")
+                return msg.get("result") or {}
+
+    def close(self) -> None:
+        try:
+            self._ws.close()
+        except Exception:
+            pass
+
+
+class SharedBrowser:
+    """One long-lived Chromium; every job gets its own browser context (cookies, storage).
+
+    Same interface as DriverPool, so app.py can swap it in with BROWSER_MODE=contexts.
+    Each lease attaches a short-lived chromedriver session to the shared browser and
+    switches it to a fresh page inside a new context; the context is disposed afterwards.
+    """
+
+    def __init__(
+        self,
+        max_contexts: int = 6,
+        checkout_timeout_sec: float = 30.0,
+        max_rss_mb: float = 0.0,
+        memory_refuse_ratio: float = 0.0,
+        watchdog_interval_sec: float = 5.0,
+    ):
+        self.max_contexts = max(1, max_contexts)
+        self.checkout_timeout_sec = checkout_timeout_sec
+        self.max_rss_bytes = int(max_rss_mb * 1024 * 1024)
+        self.memory_refuse_ratio = memory_refuse_ratio
+        self.watchdog_interval_sec = watchdog_interval_sec
+        self._proc: Optional[subprocess.Popen] = None
+        self._profile_dir: Optional[str] = None
+        self._address: Optional[str] = None
+        self._cdp: Optional[_BrowserCdp] = None
+        self._browser_lock = threading.Lock()
+        self._cond = threading.Condition()
+        self._active = 0
+        self._closed = False
+        self._draining = False
+        self._watchdog: Optional[threading.Thread] = None
+        self._rss = 0
+        self._contexts_created = 0
+        self._restarts = 0
+        self._refused = 0
+
+    @classmethod
+    def from_env(cls) -> "SharedBrowser":
+        return cls(
+            max_contexts=int(os.environ.get("CONTEXT_MAX_CONCURRENCY", "6")),
+            checkout_timeout_sec=float(os.environ.get("DRIVER_CHECKOUT_TIMEOUT_SEC", "30")),
+            max_rss_mb=float(os.environ.get("SHARED_BROWSER_MAX_RSS_MB", "3000")),
+            memory_refuse_ratio=float(os.environ.get("MEMORY_REFUSE_RATIO", "0.85")),
+            watchdog_interval_sec=float(os.environ.get("MEMORY_WATCHDOG_INTERVAL_SEC", "5")),
+        )
+
+    def memory_pressure(self) -> Optional[str]:
+        return memory_pressure(self.memory_refuse_ratio)
+
+    def _launch_browser(self) -> None:
+        profile = tempfile.mkdtemp(prefix="leadgap-chromium-")
+        args = [chrome_binary()]
+        # Bare (non --flag) entries would be opened as URLs by a directly launched Chromium.
+        args += [a for a in CHROME_ARGUMENTS if a.startswith("--")]
+        args += [
+            "--remote-debugging-port=0",
+            f"--user-data-dir={profile}",
+            "--accept-lang=en-US,en",
+            "--disable-popup-blocking",
+            "about:blank",
+        ]
+        proc = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        port_file = os.path.join(profile, "DevToolsActivePort")
+        deadline = time.monotonic() + 30
+        lines = []
+        while time.monotonic() < deadline:
+            if proc.poll() is not None:
+                shutil.rmtree(profile, ignore_errors=True)
+                raise RuntimeError(f"Chromium exited during startup (code {proc.returncode})")
+            try:
+                with open(port_file) as fh:
+                    lines = fh.read().split()
+            except OSError:
+                lines = []
+            if len(lines) >= 2:
+                break
+            time.sleep(0.1)
+        if len(lines) < 2:
+            proc.kill()
+            shutil.rmtree(profile, ignore_errors=True)
+            raise RuntimeError("Chromium did not expose a DevTools port")
+
+        self._proc = proc
+        self._profile_dir = profile
+        self._address = f"127.0.0.1:{lines[0]}"
+        self._cdp = _BrowserCdp(f"ws://{self._address}{lines[1]}")
+        log.info("shared Chromium pid=%s listening on %s", proc.pid, self._address)
+
+    def _stop_browser(self) -> None:
+        if self._cdp is not None:
+            self._cdp.close()
+        if self._proc is not None:
+            self._proc.terminate()
+            try:
+                self._proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+        if self._profile_dir:
+            shutil.rmtree(self._profile_dir, ignore_errors=True)
+        self._proc = self._cdp = self._address = self._profile_dir = None
+
+    def _ensure_browser(self) -> None:
+        with self._browser_lock:
+            if self._proc is not None and self._proc.poll() is None:
+                return
+            if self._proc is not None:
+                log.warning("shared Chromium exited (code %s); relaunching", self._proc.returncode)
+                self._stop_browser()
+                self._restarts += 1
+            self._launch_browser()
+
+    def warm(self) -> None:
+        try:
+            self._ensure_browser()
+        except Exception as ex:
+            log.error("shared Chromium warm-up failed: %s", ex)
+
+    def _acquire_slot(self, timeout: Optional[float]) -> None:
+        pressure = self.memory_pressure()
+        if pressure:
+            with self._cond:
+                self._refused += 1
+            raise DriverPoolBusy(pressure, retry_after=15)
+        wait_for = self.checkout_timeout_sec if timeout is None else timeout
+        deadline = time.monotonic() + wait_for
+        with self._cond:
+            while self._closed or self._draining or self._active >= self.max_contexts:
+                if self._closed:
+                    raise DriverPoolBusy("shared browser is shut down")
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._refused += 1
+                    raise DriverPoolBusy("all browser contexts are busy")
+                self._cond.wait(remaining)
+            self._active += 1
+
+    def _release_slot(self) -> None:
+        with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """Yield a driver bound to a fresh, isolated browser context for one job."""
+        self._acquire_slot(timeout)
+        driver = None
+        context_id = None
+        try:
+            self._ensure_browser()
+            cdp = self._cdp
+            context_id = cdp.call("Target.createBrowserContext", {"disposeOnDetach": False})["browserContextId"]
+            target_id = cdp.call(
+                "Target.createTarget", {"url": "about:blank", "browserContextId": context_id}
+            )["targetId"]
+            with self._cond:
+                self._contexts_created += 1
+            driver = attach_driver(self._address)
+            # chromedriver window handles are DevTools target ids.
+            driver.switch_to.window(target_id)
+            apply_network_policy(driver)
+            # Each context starts with an empty cookie jar.
+            preload_consent(driver)
+            yield driver
+        finally:
+            if driver is not None:
+                try:
+                    driver.quit()  # detaches only; an attached session never closes the browser
+                except Exception as ex:
+                    log.warning("context driver quit failed: %s", ex)
+            if context_id is not None and self._cdp is not None:
+                try:
+                    # Closes every tab the job opened and drops its cookies and storage.
+                    self._cdp.call("Target.disposeBrowserContext", {"browserContextId": context_id})
+                except Exception as ex:
+                    log.warning("dispose context failed: %s", ex)
+            self._release_slot()
+
+    def start_watchdog(self) -> None:
+        """Drain and relaunch the shared browser when its process tree outgrows the RSS cap."""
+        if self.max_rss_bytes <= 0 or self._watchdog is not None:
+            return
+        self._watchdog = threading.Thread(target=self._watch, name="shared-browser-rss", daemon=True)
+        self._watchdog.start()
+
+    def _watch(self) -> None:
+        while not self._closed:
+            time.sleep(self.watchdog_interval_sec)
+            proc = self._proc
+            self._rss = process_tree_rss(proc.pid) if proc is not None else 0
+            with self._cond:
+                if self._rss > self.max_rss_bytes and not self._draining:
+                    log.info("draining shared Chromium at %d MB", self._rss // (1024 * 1024))
+                    self._draining = True
+                restart = self._draining and self._active == 0
+            if restart:
+                with self._browser_lock:
+                    self._stop_browser()
+                    self._restarts += 1
+                self.warm()
+                with self._cond:
+                    self._draining = False
+                    self._cond.notify_all()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        with self._browser_lock:
+            self._stop_browser()
+
+    def stats(self) -> Dict[str, Any]:
+        used, limit = container_memory()
+        with self._cond:
+            return {
+                "mode": "contexts",
+                "active_contexts": self._active,
+                "max_contexts": self.max_contexts,
+                "contexts_created": self._contexts_created,
+                "draining": self._draining,
+                "restarts": self._restarts,
+                "refused": self._refused,
+                "browser_pid": self._proc.pid if self._proc is not None else None,
+                "browser_rss_mb": round(self._rss / (1024 * 1024), 1),
+                "browser_max_rss_mb": round(self.max_rss_bytes / (1024 * 1024), 1),
+                "container_used_mb": round(used / (1024 * 1024), 1) if used else None,
+                "container_limit_mb": round(limit / (1024 * 1024), 1) if limit else None,
+                "memory_refuse_ratio": self.memory_refuse_ratio,
+            }
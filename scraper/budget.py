@@ -0,0 +1,74 @@
+import os
+import time
+from typing import Any, Dict, List
+
+
+class BudgetScheduler:
+    """Splits what is left of a scrape's deadline across the places not yet scraped.
+
+    Each place's slice is the remaining time weighted by its expected yield
+    against the other open places, so one slow place cannot starve the rest.
+    Slices under SCHEDULER_TIGHT_SLICE_SEC are "tight": optional stages
+    (overview snippets, the "More reviews" probe) are skipped for them.
+    """
+
+    def __init__(self, deadline: float, targets: List[Dict[str, Any]]):
+        self.deadline = deadline
+        self.started = time.monotonic()
+        self.min_slice = float(os.environ.get("SCHEDULER_MIN_SLICE_SEC", "4"))
+        self.tight_slice = float(os.environ.get("SCHEDULER_TIGHT_SLICE_SEC", "10"))
+        self._open: Dict[str, float] = {
+            t["link"]: max(1.0, float(t.get("expected_yield") or 0.0)) for t in targets
+        }
+        self._names = {t["link"]: t.get("name") for t in targets}
+        self._spent: Dict[str, float] = {}
+        self._slices: Dict[str, float] = {}
+        self._skipped: Dict[str, List[str]] = {}
+        self.places: List[Dict[str, Any]] = []
+
+    def remaining(self) -> float:
+        return max(0.0, self.deadline - time.monotonic())
+
+    def slice_for(self, key: str) -> float:
+        """Seconds this place may use now: its yield-weighted share of the remaining budget."""
+        remaining = self.remaining()
+        if remaining <= 0 or key not in self._open:
+            return 0.0
+        share = remaining * self._open[key] / sum(self._open.values())
+        return min(remaining, max(self.min_slice, share))
+
+    def tight(self, key: str) -> bool:
+        return self.slice_for(key) < self.tight_slice
+
+    def grant(self, key: str) -> float:
+        """Record and return the slice a place starts its reviews stage with."""
+        slice_sec = self.slice_for(key)
+        self._slices[key] = slice_sec
+        return slice_sec
+
+    def charge(self, key: str, started: float) -> None:
+        self._spent[key] = self._spent.get(key, 0.0) + time.monotonic() - started
+
+    def skip(self, key: str, stage: str) -> None:
+        self._skipped.setdefault(key, []).append(stage)
+
+    def done(self, key: str, name: str, rows: int) -> None:
+        self._open.pop(key, None)
+        self.places.append({
+            "business_name": name or self._names.get(key),
+            "slice_sec": round(self._slices.get(key, 0.0), 2),
+            "spent_sec": round(self._spent.get(key, 0.0), 2),
+            "rows": rows,
+            "skipped": self._skipped.get(key, []),
+        })
+
+    def summary(self) -> Dict[str, Any]:
+        spent = sum(self._spent.values())
+        return {
+            "budget_sec": round(self.deadline - self.started, 2),
+            "places_sec": round(spent, 2),
+            "overhead_sec": round(max(0.0, time.monotonic() - self.started - spent), 2),
+            "unspent_sec": round(self.remaining(), 2),
+            "places": list(self.places),
+            "not_reached": [self._names.get(key) for key in self._open],
+        }
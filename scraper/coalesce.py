@@ -0,0 +1,62 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from result_cache import cache_key, trim_result
+
+
+class _Inflight:
+    def __init__(self, request: Any, task: "asyncio.Future[Any]"):
+        self.reviews_per_business = request.reviews_per_business
+        self.max_businesses = request.max_businesses
+        self.task = task
+
+    def covers(self, request: Any) -> bool:
+        if request.reviews_per_business > self.reviews_per_business:
+            return False
+        return request.mode == "competitor" or request.max_businesses <= self.max_businesses
+
+
+class ScrapeCoalescer:
+    """Share one in-flight scrape between concurrent requests it can satisfy.
+
+    Runs on the event loop thread only, so no locking is needed.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[str, List[_Inflight]] = {}
+        self.started = 0
+        self.joined = 0
+
+    def _forget(self, key: str, entry: _Inflight) -> None:
+        if not entry.task.cancelled():
+            entry.task.exception()  # mark retrieved even if every waiter went away
+        entries = self._inflight.get(key, [])
+        if entry in entries:
+            entries.remove(entry)
+        if not entries:
+            self._inflight.pop(key, None)
+
+    async def run(self, request: Any, start: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """Return (data, shared); `start` is only invoked when no running scrape covers the request."""
+        # Same key as the result cache: the same Maps search, mode and star range.
+        key = cache_key(request)
+        for entry in self._inflight.get(key, []):
+            if entry.covers(request):
+                self.joined += 1
+                data = await asyncio.shield(entry.task)
+                return trim_result(data, request.mode, request.reviews_per_business, request.max_businesses), True
+
+        entry = _Inflight(request, asyncio.ensure_future(start()))
+        self._inflight.setdefault(key, []).append(entry)
+        # Drop the entry when the scrape ends, not when this caller does: a
+        # disconnecting leader must not strand the requests that joined it.
+        entry.task.add_done_callback(lambda _t: self._forget(key, entry))
+        self.started += 1
+        return await asyncio.shield(entry.task), False
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "inflight": sum(len(v) for v in self._inflight.values()),
+            "started": self.started,
+            "joined": self.joined,
+        }
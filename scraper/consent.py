@@ -0,0 +1,90 @@
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+log = logging.getLogger("leadgap.scraper.consent")
+
+# Cookies Google sets once the consent dialog has been answered.
+CONSENT_COOKIE_NAMES = ("SOCS", "CONSENT")
+
+_lock = threading.Lock()
+_cached: Optional[List[Dict[str, Any]]] = None
+_loaded = False
+
+
+def _profile_path() -> str:
+    return os.environ.get("CONSENT_PROFILE_PATH", "/tmp/leadgap-scraper/consent.json")
+
+
+def load_consent_cookies() -> List[Dict[str, Any]]:
+    """Consent cookies captured by an earlier scrape (from CONSENT_PROFILE_PATH), or []."""
+    global _cached, _loaded
+    with _lock:
+        if _loaded:
+            return list(_cached or [])
+        _loaded = True
+        path = _profile_path()
+        if not path:
+            return []
+        try:
+            with open(path) as fh:
+                _cached = json.load(fh)
+        except (OSError, ValueError):
+            _cached = []
+        return list(_cached or [])
+
+
+def save_consent_cookies(driver) -> int:
+    """Capture the consent cookies of the current page's session and persist them."""
+    global _cached, _loaded
+    try:
+        cookies = [c for c in driver.get_cookies() if c.get("name") in CONSENT_COOKIE_NAMES]
+    except Exception as ex:
+        log.warning("reading consent cookies failed: %s", ex)
+        return 0
+    if not cookies:
+        return 0
+    with _lock:
+        _cached = cookies
+        _loaded = True
+        path = _profile_path()
+        if path:
+            try:
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                with open(path, "w") as fh:
+                    json.dump(cookies, fh)
+            except OSError as ex:
+                log.warning("saving consent profile failed: %s", ex)
+    log.info("captured %d consent cookies", len(cookies))
+    return len(cookies)
+
+
+def _cdp_cookie(cookie: Dict[str, Any]) -> Dict[str, Any]:
+    out = {
+        "name": cookie["name"],
+        "value": cookie["value"],
+        "domain": cookie.get("domain") or ".google.com",
+        "path": cookie.get("path") or "/",
+        "secure": bool(cookie.get("secure", True)),
+        "httpOnly": bool(cookie.get("httpOnly", False)),
+    }
+    if cookie.get("expiry"):
+        out["expires"] = cookie["expiry"]
+    if cookie.get("sameSite"):
+        out["sameSite"] = cookie["sameSite"]
+    return out
+
+
+def preload_consent(driver) -> bool:
+    """Install saved consent cookies into the current tab's browser context before any navigation."""
+    cookies = load_consent_cookies()
+    if not cookies:
+        return False
+    try:
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": [_cdp_cookie(c) for c in cookies]})
+        return True
+    except Exception as ex:
+        log.warning("preloading consent cookies failed: %s", ex)
+        return False
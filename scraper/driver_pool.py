@@ -0,0 +1,343 @@
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from selenium.common.exceptions import WebDriverException
+
+from memory_watch import container_memory, driver_root_pid, memory_pressure, process_tree_rss
+from scraper_engine import get_driver
+
+log = logging.getLogger("leadgap.scraper.pool")
+
+
+class DriverPoolBusy(RuntimeError):
+    """No browser could be handed out in time; the caller should retry later."""
+
+    def __init__(self, reason: str, retry_after: int = 5):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class PooledDriver:
+    """A launched Chromium session plus the bookkeeping used to recycle it."""
+
+    def __init__(self, driver: Any):
+        self.driver = driver
+        self.created_at = time.monotonic()
+        self.jobs = 0
+        self.rss = 0
+        self.drain = False  # set by the watchdog; the driver is retired when returned
+
+    def sample_rss(self) -> int:
+        self.rss = process_tree_rss(driver_root_pid(self.driver))
+        return self.rss
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.created_at
+
+
+def _is_healthy(driver: Any) -> bool:
+    try:
+        driver.execute_script("return 1")
+        return True
+    except Exception:
+        return False
+
+
+def _reset_driver(driver: Any) -> None:
+    """Close extra tabs and park the first one on about:blank; cookies are kept."""
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+    driver.get("about:blank")
+
+
+def _quit(driver: Any) -> None:
+    try:
+        driver.quit()
+    except Exception as ex:
+        log.warning("driver quit failed: %s", ex)
+
+
+class DriverPool:
+    """Bounded pool of pre-launched Chromium drivers checked out per request."""
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_jobs: int = 20,
+        max_age_sec: float = 900.0,
+        checkout_timeout_sec: float = 30.0,
+        max_rss_mb: float = 0.0,
+        memory_refuse_ratio: float = 0.0,
+        watchdog_interval_sec: float = 5.0,
+    ):
+        self.size = max(1, size)
+        self.max_jobs = max_jobs
+        self.max_age_sec = max_age_sec
+        self.checkout_timeout_sec = checkout_timeout_sec
+        self.max_rss_bytes = int(max_rss_mb * 1024 * 1024)
+        self.memory_refuse_ratio = memory_refuse_ratio
+        self.watchdog_interval_sec = watchdog_interval_sec
+        self._idle: List[PooledDriver] = []
+        self._leased: Set[PooledDriver] = set()
+        self._total = 0  # idle + leased + launching
+        self._warming = 0  # background launches in flight
+        self._cond = threading.Condition()
+        self._closed = False
+        self._launched = 0
+        self._retired = 0
+        self._refused = 0
+        self._watchdog: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_env(cls) -> "DriverPool":
+        return cls(
+            size=int(os.environ.get("DRIVER_POOL_SIZE", "2")),
+            max_jobs=int(os.environ.get("DRIVER_MAX_JOBS", "20")),
+            max_age_sec=float(os.environ.get("DRIVER_MAX_AGE_SEC", "900")),
+            checkout_timeout_sec=float(os.environ.get("DRIVER_CHECKOUT_TIMEOUT_SEC", "30")),
+            max_rss_mb=float(os.environ.get("DRIVER_MAX_RSS_MB", "1200")),
+            memory_refuse_ratio=float(os.environ.get("MEMORY_REFUSE_RATIO", "0.85")),
+            watchdog_interval_sec=float(os.environ.get("MEMORY_WATCHDOG_INTERVAL_SEC", "5")),
+        )
+
+    def _expired(self, slot: PooledDriver) -> bool:
+        if self.max_jobs > 0 and slot.jobs >= self.max_jobs:
+            return True
+        return self.max_age_sec > 0 and slot.age >= self.max_age_sec
+
+    def _over_rss(self, slot: PooledDriver) -> bool:
+        return self.max_rss_bytes > 0 and slot.rss > self.max_rss_bytes
+
+    def memory_pressure(self) -> Optional[str]:
+        return memory_pressure(self.memory_refuse_ratio)
+
+    def _launch(self) -> PooledDriver:
+        slot = PooledDriver(get_driver())
+        with self._cond:
+            self._launched += 1
+        return slot
+
+    def _retire(self, slot: PooledDriver, why: str) -> None:
+        log.info("retiring driver (%s) after %d jobs, %.0fs", why, slot.jobs, slot.age)
+        _quit(slot.driver)
+        with self._cond:
+            self._total -= 1
+            self._retired += 1
+            self._cond.notify()
+
+    def _replenish(self) -> None:
+        threading.Thread(target=self.warm, name="driver-pool-refill", daemon=True).start()
+
+    def warm(self) -> None:
+        """Launch drivers until the pool is full; safe to call from a background thread."""
+        while True:
+            with self._cond:
+                if self._closed or self._total >= self.size:
+                    return
+                if self.memory_pressure():
+                    return
+                self._total += 1
+                self._warming += 1
+            try:
+                slot = self._launch()
+            except Exception as ex:
+                log.error("driver warm-up failed: %s", ex)
+                with self._cond:
+                    self._total -= 1
+                    self._warming -= 1
+                    self._cond.notify_all()
+                return
+            with self._cond:
+                self._warming -= 1
+                self._idle.append(slot)
+                self._cond.notify_all()
+
+    def _take_expired_idle(self) -> List[PooledDriver]:
+        """Remove idle drivers past a recycle limit from the pool; caller holds the lock and quits them."""
+        expired = [slot for slot in self._idle if self._expired(slot)]
+        for slot in expired:
+            self._idle.remove(slot)
+            self._total -= 1
+            self._retired += 1
+        return expired
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledDriver:
+        pressure = self.memory_pressure()
+        if pressure:
+            with self._cond:
+                self._refused += 1
+            raise DriverPoolBusy(pressure, retry_after=15)
+
+        wait_for = self.checkout_timeout_sec if timeout is None else timeout
+        deadline = time.monotonic() + wait_for
+        slot: Optional[PooledDriver] = None
+        expired: List[PooledDriver] = []
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise DriverPoolBusy("driver pool is shut down")
+                expired.extend(self._take_expired_idle())
+                if self._idle:
+                    slot = self._idle.pop()
+                    break
+                # A driver warming in the background beats a cold launch on this request.
+                if self._total < self.size and not self._warming:
+                    self._total += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._refused += 1
+                    raise DriverPoolBusy("all browsers are busy")
+                self._cond.wait(remaining)
+        for stale in expired:
+            _quit(stale.driver)
+        if expired:
+            self._replenish()
+
+        if slot is not None and not _is_healthy(slot.driver):
+            _quit(slot.driver)
+            with self._cond:
+                self._retired += 1
+            slot = None
+
+        if slot is None:
+            try:
+                slot = self._launch()
+            except Exception:
+                with self._cond:
+                    self._total -= 1
+                    self._cond.notify()
+                raise
+        with self._cond:
+            self._leased.add(slot)
+        return slot
+
+    def release(self, slot: PooledDriver, broken: bool = False) -> None:
+        slot.jobs += 1
+        with self._cond:
+            self._leased.discard(slot)
+        if self._closed:
+            self._retire(slot, "shutdown")
+            return
+        if broken:
+            self._retire(slot, "webdriver error")
+            self._replenish()
+            return
+        if self._expired(slot):
+            self._retire(slot, "recycle limit")
+            self._replenish()
+            return
+        slot.sample_rss()
+        if slot.drain or self._over_rss(slot):
+            self._retire(slot, f"rss {slot.rss // (1024 * 1024)} MB")
+            self._replenish()
+            return
+        try:
+            _reset_driver(slot.driver)
+        except Exception as ex:
+            self._retire(slot, f"reset failed: {ex}")
+            self._replenish()
+            return
+        with self._cond:
+            self._idle.append(slot)
+            self._cond.notify()
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """Check out a driver for one job and return it (reset or recycled) afterwards."""
+        slot = self.acquire(timeout)
+        broken = False
+        try:
+            yield slot.driver
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            self.release(slot, broken=broken)
+
+    def start_watchdog(self) -> None:
+        """Sample Chromium RSS periodically; drain leased offenders, replace idle ones.
+
+        Idle drivers past a recycle limit are replaced here too, so the first
+        request after a quiet spell finds a warm driver instead of launching one.
+        """
+        if (self.max_rss_bytes <= 0 and self.max_age_sec <= 0) or self._watchdog is not None:
+            return
+        self._watchdog = threading.Thread(target=self._watch, name="driver-pool-rss", daemon=True)
+        self._watchdog.start()
+
+    def _watch(self) -> None:
+        while not self._closed:
+            time.sleep(self.watchdog_interval_sec)
+            with self._cond:
+                idle = list(self._idle)
+                leased = list(self._leased)
+            with self._cond:
+                expired = self._take_expired_idle()
+            for slot in expired:
+                log.info("retiring idle driver (recycle limit) after %d jobs, %.0fs", slot.jobs, slot.age)
+                _quit(slot.driver)
+            if expired:
+                self._replenish()
+            if self.max_rss_bytes <= 0:
+                continue
+            for slot in leased:
+                slot.sample_rss()
+                if self._over_rss(slot):
+                    if not slot.drain:
+                        log.info("draining leased driver at %d MB", slot.rss // (1024 * 1024))
+                    slot.drain = True
+            offenders = []
+            for slot in idle:
+                if slot in expired:
+                    continue
+                slot.sample_rss()
+                if self._over_rss(slot):
+                    with self._cond:
+                        if slot in self._idle:
+                            self._idle.remove(slot)
+                            offenders.append(slot)
+            for slot in offenders:
+                self._retire(slot, f"idle rss {slot.rss // (1024 * 1024)} MB")
+            if offenders:
+                self._replenish()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for slot in idle:
+            self._retire(slot, "shutdown")
+
+    def stats(self) -> Dict[str, Any]:
+        used, limit = container_memory()
+        with self._cond:
+            drivers = list(self._idle) + list(self._leased)
+            return {
+                "mode": "pool",
+                "size": self.size,
+                "total": self._total,
+                "idle": len(self._idle),
+                "warming": self._warming,
+                "leased": self._total - len(self._idle),
+                "launched": self._launched,
+                "retired": self._retired,
+                "max_jobs": self.max_jobs,
+                "max_age_sec": self.max_age_sec,
+                "refused": self._refused,
+                "driver_rss_mb": [round(slot.rss / (1024 * 1024), 1) for slot in drivers],
+                "driver_max_rss_mb": round(self.max_rss_bytes / (1024 * 1024), 1),
+                "container_used_mb": round(used / (1024 * 1024), 1) if used else None,
+                "container_limit_mb": round(limit / (1024 * 1024), 1) if limit else None,
+                "memory_refuse_ratio": self.memory_refuse_ratio,
+            }
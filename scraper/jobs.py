@@ -0,0 +1,97 @@
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+
+class ScrapeJob:
+    """State of one background scrape; rows accumulate while the engine runs."""
+
+    def __init__(self, request: Dict[str, Any]):
+        self.id = uuid.uuid4().hex
+        self.request = request
+        self.status = "queued"
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.rows: List[dict] = []
+        self.businesses: List[str] = []
+        self.result: Any = None
+        self.error: Optional[str] = None
+        # Filled in by the engine when the scrape ends (timings, network counters).
+        self.report: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def mark_running(self) -> None:
+        with self._lock:
+            self.status = "running"
+            self.started_at = time.time()
+
+    def add_rows(self, business_name: str, rows: List[dict]) -> None:
+        with self._lock:
+            self.rows.extend(rows)
+            if business_name not in self.businesses:
+                self.businesses.append(business_name)
+
+    def finish(self, result: Any) -> None:
+        with self._lock:
+            self.status = "done"
+            self.result = result
+            self.finished_at = time.time()
+
+    def fail(self, error: str) -> None:
+        with self._lock:
+            self.status = "failed"
+            self.error = error
+            self.finished_at = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            end = self.finished_at or time.time()
+            return {
+                "job_id": self.id,
+                "status": self.status,
+                "request": self.request,
+                "created_at": self.created_at,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+                "elapsed_sec": round(end - self.started_at, 2) if self.started_at else None,
+                "businesses": list(self.businesses),
+                "partial_count": len(self.rows),
+                "partial_rows": list(self.rows),
+                "result": self.result,
+                "report": dict(self.report),
+                "error": self.error,
+            }
+
+
+class JobStore:
+    """In-process job registry; finished jobs are dropped after `ttl_sec`."""
+
+    def __init__(self, ttl_sec: float = 3600.0):
+        self.ttl_sec = ttl_sec
+        self._jobs: Dict[str, ScrapeJob] = {}
+        self._lock = threading.Lock()
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.ttl_sec
+        for job_id in [j.id for j in self._jobs.values() if j.finished_at and j.finished_at < cutoff]:
+            del self._jobs[job_id]
+
+    def create(self, request: Dict[str, Any]) -> ScrapeJob:
+        job = ScrapeJob(request)
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[ScrapeJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            out: Dict[str, int] = {}
+            for job in self._jobs.values():
+                out[job.status] = out.get(job.status, 0) + 1
+            return out
@@ -0,0 +1,134 @@
+import os
+from typing import Dict, List, Optional, Tuple
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _children_map() -> Dict[int, List[int]]:
+    children: Dict[int, List[int]] = {}
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return children
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "rb") as fh:
+                stat = fh.read().decode("utf-8", "replace")
+        except OSError:
+            continue
+        # comm may contain spaces/parens; ppid is the 2nd field after the last ')'.
+        fields = stat.rsplit(")", 1)[-1].split()
+        if len(fields) < 2:
+            continue
+        children.setdefault(int(fields[1]), []).append(int(entry))
+    return children
+
+
+def _pid_rss(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/statm", "rb") as fh:
+            return int(fh.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+def process_tree_rss(root_pid: Optional[int]) -> int:
+    """Resident bytes of a process and all of its descendants (Linux /proc)."""
+    if not root_pid:
+        return 0
+    children = _children_map()
+    total = 0
+    stack = [root_pid]
+    seen = set()
+    while stack:
+        pid = stack.pop()
+        if pid in seen:
+            continue
+        seen.add(pid)
+        total += _pid_rss(pid)
+        stack.extend(children.get(pid, ()))
+    return total
+
+
+def driver_root_pid(driver) -> Optional[int]:
+    """PID of the chromedriver process; Chromium and its renderers are its descendants."""
+    process = getattr(getattr(driver, "service", None), "process", None)
+    return getattr(process, "pid", None)
+
+
+def _read_int(path: str) -> Optional[int]:
+    try:
+        with open(path) as fh:
+            raw = fh.read().strip()
+    except OSError:
+        return None
+    if not raw or raw == "max":
+        return None
+    try:
+        return int(raw)
+    except ValueError:
+        return None
+
+
+def _meminfo() -> Tuple[Optional[int], Optional[int]]:
+    values: Dict[str, int] = {}
+    try:
+        with open("/proc/meminfo") as fh:
+            for line in fh:
+                key, _, rest = line.partition(":")
+                values[key] = int(rest.split()[0]) * 1024
+    except (OSError, ValueError, IndexError):
+        return None, None
+    total = values.get("MemTotal")
+    available = values.get("MemAvailable")
+    if total is None or available is None:
+        return None, None
+    return total - available, total
+
+
+def _stat_value(path: str, key: str) -> int:
+    """One counter from a cgroup memory.stat file, or 0."""
+    try:
+        with open(path) as fh:
+            for line in fh:
+                name, _, value = line.partition(" ")
+                if name == key:
+                    return int(value)
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+def container_memory() -> Tuple[Optional[int], Optional[int]]:
+    """(working set, limit) bytes for this container: cgroup v2, then v1, then host meminfo.
+
+    Usage counts reclaimable page cache (SQLite files, Chromium's disk cache), so
+    inactive file pages are subtracted, as kubelet does for its working set.
+    """
+    for used_path, limit_path, stat_path, inactive_key in (
+        ("/sys/fs/cgroup/memory.current", "/sys/fs/cgroup/memory.max",
+         "/sys/fs/cgroup/memory.stat", "inactive_file"),
+        ("/sys/fs/cgroup/memory/memory.usage_in_bytes", "/sys/fs/cgroup/memory/memory.limit_in_bytes",
+         "/sys/fs/cgroup/memory/memory.stat", "total_inactive_file"),
+    ):
+        used = _read_int(used_path)
+        limit = _read_int(limit_path)
+        # cgroup v1 reports "no limit" as a huge page-aligned number.
+        if used is not None and limit is not None and limit < (1 << 60):
+            return max(0, used - _stat_value(stat_path, inactive_key)), limit
+    return _meminfo()
+
+
+def memory_pressure(refuse_ratio: float) -> Optional[str]:
+    """Reason string when container memory is too close to its limit for new work."""
+    if refuse_ratio <= 0:
+        return None
+    used, limit = container_memory()
+    if not used or not limit:
+        return None
+    ratio = used / limit
+    if ratio >= refuse_ratio:
+        return f"memory {ratio:.0%} of container limit"
+    return None
@@ -0,0 +1,225 @@
+import fnmatch
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from review_payload import is_review_response
+
+# Groups for BLOCKED_RESOURCE_GROUPS. Network.setBlockedURLs only matches URL
+# patterns (with `*` wildcards), so resource types are expressed as URL groups.
+BLOCK_GROUPS: Dict[str, List[str]] = {
+    "font": [
+        "*fonts.gstatic.com/*",
+        "*fonts.googleapis.com/*",
+        "*.woff2*",
+        "*.woff?*",
+        "*.ttf*",
+        "*.otf*",
+    ],
+    "tile": [
+        "*/maps/vt?*",
+        "*/maps/vt/*",
+        "*/kh/v=*",
+        "*khms*.googleapis.com/*",
+        "*streetviewpixels-pa.googleapis.com/*",
+        "*/maps/preview/photo?*",
+    ],
+    "telemetry": [
+        "*/gen_204*",
+        "*/csi?*",
+        "*play.google.com/log*",
+        "*/maps/preview/log204*",
+        "*google-analytics.com/*",
+        "*googletagmanager.com/*",
+        "*doubleclick.net/*",
+    ],
+    "media": [
+        "*.mp4*",
+        "*.webm*",
+        "*.mp3*",
+    ],
+    "image": [
+        "*.png*",
+        "*.jpg*",
+        "*.jpeg*",
+        "*.gif*",
+        "*.webp*",
+        "*lh3.googleusercontent.com/*",
+        "*lh5.googleusercontent.com/*",
+    ],
+}
+
+
+def _env_list(name: str, default: str) -> List[str]:
+    return [item.strip() for item in os.environ.get(name, default).split(",") if item.strip()]
+
+
+def blocked_patterns() -> List[str]:
+    """URL patterns from BLOCKED_RESOURCE_GROUPS plus any raw BLOCKED_URL_PATTERNS."""
+    if os.environ.get("NETWORK_BLOCKING", "1") == "0":
+        return []
+    patterns: List[str] = []
+    for group in _env_list("BLOCKED_RESOURCE_GROUPS", "font,tile,telemetry"):
+        patterns.extend(BLOCK_GROUPS.get(group, []))
+    patterns.extend(_env_list("BLOCKED_URL_PATTERNS", ""))
+    return patterns
+
+
+def _group_for(url: str) -> str:
+    for group, patterns in BLOCK_GROUPS.items():
+        if any(fnmatch.fnmatchcase(url, p) for p in patterns):
+            return group
+    return "custom"
+
+
+def apply_network_policy(driver) -> bool:
+    """Enable the Network domain on the current tab and install the URL blocklist."""
+    patterns = blocked_patterns()
+    if not patterns:
+        return False
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        return True
+    except Exception:
+        return False
+
+
+_totals: Dict[str, int] = {}
+_totals_lock = threading.Lock()
+
+
+def network_totals() -> Dict[str, int]:
+    with _totals_lock:
+        return dict(_totals)
+
+
+# The only CDP events NetworkTap reads.
+_COUNTED_EVENTS = ('"Network.requestWillBeSent"', '"Network.loadingFinished"', '"Network.loadingFailed"')
+
+
+class NetworkTap:
+    """Per-scrape view of chromedriver's performance log (CDP Network events).
+
+    Only events from the tabs this scrape registered are counted, since in
+    shared-browser mode the log also carries other jobs' pages.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.webviews: Set[str] = set()
+        self.allowed_requests = 0
+        self.allowed_bytes = 0
+        self.failed_requests = 0
+        self.blocked_requests = 0
+        self.blocked_by_group: Dict[str, int] = {}
+        self.bytes_by_type: Dict[str, int] = {}
+        self._types: Dict[str, str] = {}
+        self._urls: Dict[str, str] = {}
+        # (requestId, tab) of finished review XHRs whose bodies have not been read yet.
+        self._review_responses: List[Tuple[str, Optional[str]]] = []
+        try:
+            self.webviews.add(driver.current_window_handle)
+        except Exception:
+            pass
+        self.drain()  # discard whatever a previous job on this driver left behind
+
+    def watch(self, handle: str) -> None:
+        self.webviews.add(handle)
+
+    def drain(self) -> None:
+        """Consume pending log entries and update counters."""
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception:
+            return
+        for entry in entries:
+            raw = entry.get("message") or ""
+            # Most of the log is Network.dataReceived and friends; skip those unparsed.
+            if not any(method in raw for method in _COUNTED_EVENTS):
+                continue
+            try:
+                wrapper = json.loads(raw)
+                message = wrapper["message"]
+            except (KeyError, ValueError, TypeError):
+                continue
+            webview = wrapper.get("webview")
+            if webview and self.webviews and webview not in self.webviews:
+                continue
+            self._count(message, webview)
+
+    def _count(self, message: Dict[str, Any], webview: Optional[str]) -> None:
+        method = message.get("method")
+        params = message.get("params") or {}
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            self._types[request_id] = params.get("type") or "Other"
+            self._urls[request_id] = (params.get("request") or {}).get("url", "")
+        elif method == "Network.loadingFinished":
+            size = int(params.get("encodedDataLength") or 0)
+            rtype = self._types.get(request_id, "Other")
+            self.allowed_requests += 1
+            self.allowed_bytes += size
+            self.bytes_by_type[rtype] = self.bytes_by_type.get(rtype, 0) + size
+            if is_review_response(self._urls.get(request_id, "")):
+                self._review_responses.append((request_id, webview))
+        elif method == "Network.loadingFailed":
+            if params.get("blockedReason"):
+                self.blocked_requests += 1
+                group = _group_for(self._urls.get(request_id, ""))
+                self.blocked_by_group[group] = self.blocked_by_group.get(group, 0) + 1
+            else:
+                self.failed_requests += 1
+
+    def review_bodies(self) -> List[str]:
+        """Bodies of review XHRs the current tab finished since the last call, oldest first."""
+        self.drain()
+        try:
+            handle = self.driver.current_window_handle
+        except Exception:
+            return []
+        bodies: List[str] = []
+        pending: List[Tuple[str, Optional[str]]] = []
+        for request_id, webview in self._review_responses:
+            if webview and webview != handle:
+                pending.append((request_id, webview))
+                continue
+            try:
+                # getResponseBody is per target, so it only works from the tab that made the request.
+                body = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+                bodies.append(body.get("body") or "")
+            except Exception:
+                continue  # evicted from the DevTools buffer
+        self._review_responses = pending
+        return bodies
+
+    def summary(self) -> Dict[str, Any]:
+        self.drain()
+        out = {
+            "allowed_requests": self.allowed_requests,
+            "allowed_bytes": self.allowed_bytes,
+            "blocked_requests": self.blocked_requests,
+            "failed_requests": self.failed_requests,
+            "blocked_by_group": dict(self.blocked_by_group),
+            "bytes_by_type": dict(self.bytes_by_type),
+        }
+        with _totals_lock:
+            for key in ("allowed_requests", "allowed_bytes", "blocked_requests", "failed_requests"):
+                _totals[key] = _totals.get(key, 0) + out[key]
+        return out
+
+
+def metrics_enabled() -> bool:
+    """Performance logging is opt-in (NETWORK_METRICS=1); the network review backend needs it too."""
+    return (
+        os.environ.get("NETWORK_METRICS", "0") == "1"
+        or os.environ.get("REVIEW_EXTRACTION_BACKEND", "dom") == "network"
+    )
+
+
+def tap_or_none(driver) -> Optional[NetworkTap]:
+    """A NetworkTap when performance logging is enabled, else None."""
+    if not metrics_enabled():
+        return None
+    return NetworkTap(driver)
@@ -0,0 +1,198 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+# Connectors users put between niche and place ("plumber in Austin"); Maps ignores them.
+_CONNECTORS = {"in", "near", "around"}
+# Words keep inner hyphens, apostrophes and ampersands ("in-n-out", "joe's", "b&b").
+_TOKEN = re.compile(r"\w+(?:['&-]\w+)*")
+
+
+def _singular(token: str) -> str:
+    """Fold a plain trailing "s" ("plumbers" -> "plumber"); "glass", "bus", "tennis" stay."""
+    if len(token) <= 3 or not token.isalpha():
+        return token
+    if token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+
+def canonical_query(query: Optional[str], location: Optional[str] = None) -> str:
+    """Normalize the text that ends up in `_maps_search_url` for use as a cache key.
+
+    "Plumbers in  Austin, TX" and "plumber austin tx" (with location "Austin, TX")
+    map to the same key. A connector is dropped only as a whole word between the
+    niche and the place, and only the niche's last word is singularized; without
+    a connector or a separate location that word is unknown and nothing is folded.
+    """
+    tokens = _TOKEN.findall(str(query or "").lower())
+    niche, place = tokens, []
+    for index in range(1, len(tokens) - 1):
+        if tokens[index] in _CONNECTORS:
+            niche, place = tokens[:index], tokens[index + 1:]
+            break
+    loc = str(location or "").strip()
+    if loc and loc.lower() != "unknown location":
+        place = place + _TOKEN.findall(loc.lower())
+    if niche and place:
+        niche = niche[:-1] + [_singular(niche[-1])]
+    return " ".join(niche + place)
+
+
+def cache_key(request: Any) -> str:
+    parts = [
+        request.mode,
+        canonical_query(request.query, request.location),
+        str(int(request.min_stars)),
+        str(int(request.max_stars)),
+        "incremental" if getattr(request, "incremental", False) else "full",
+    ]
+    if getattr(request, "deep", False):
+        parts.append(f"deep:{getattr(request, 'since_days', None) or 'all'}")
+    if request.mode == "census":
+        parts.append(f"hist:{getattr(request, 'histograms', 0)}")
+    return "|".join(parts)
+
+
+def trim_result(data: Any, mode: str, reviews_per_business: int, max_businesses: int) -> Any:
+    """Cut a result from a larger scrape down to what a smaller request asked for."""
+    if isinstance(data, dict):
+        trimmed = dict(data)
+        trimmed["reviews"] = list(data.get("reviews") or [])[:reviews_per_business]
+        return trimmed
+    if mode == "competitor" or not isinstance(data, list):
+        return data
+    if mode == "census":
+        return data[:max_businesses]
+
+    businesses: List[str] = []
+    per_business: Dict[str, int] = {}
+    out = []
+    for row in data:
+        name = row.get("business_name", "")
+        if name not in per_business:
+            if len(businesses) >= max_businesses:
+                continue
+            businesses.append(name)
+            per_business[name] = 0
+        if per_business[name] >= reviews_per_business:
+            continue
+        per_business[name] += 1
+        out.append(row)
+    return out
+
+
+class _Entry:
+    __slots__ = ("stored_at", "reviews_per_business", "max_businesses", "data")
+
+    def __init__(self, stored_at: float, reviews_per_business: int, max_businesses: int, data: Any):
+        self.stored_at = stored_at
+        self.reviews_per_business = reviews_per_business
+        self.max_businesses = max_businesses
+        self.data = data
+
+    def covers(self, request: Any) -> bool:
+        if request.reviews_per_business > self.reviews_per_business:
+            return False
+        return request.mode == "competitor" or request.max_businesses <= self.max_businesses
+
+
+class ResultCache:
+    """In-process LRU in front of an on-disk SQLite store, with a TTL per scrape mode."""
+
+    def __init__(self, path: Optional[str], max_entries: int, ttls: Dict[str, float]):
+        self.max_entries = max_entries
+        self.ttls = ttls
+        self._lru: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+        if path:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, stored_at REAL, reviews_per_business INTEGER, "
+                "max_businesses INTEGER, payload TEXT)"
+            )
+            self._db.commit()
+
+    @classmethod
+    def from_env(cls) -> "ResultCache":
+        return cls(
+            path=os.environ.get("RESULT_CACHE_PATH", "/tmp/leadgap-scraper/results.sqlite3"),
+            max_entries=int(os.environ.get("RESULT_CACHE_MAX_ENTRIES", "256")),
+            ttls={
+                "niche": float(os.environ.get("CACHE_TTL_NICHE_SEC", "86400")),
+                "competitor": float(os.environ.get("CACHE_TTL_COMPETITOR_SEC", "21600")),
+                "census": float(os.environ.get("CACHE_TTL_CENSUS_SEC", "86400")),
+            },
+        )
+
+    def _ttl(self, mode: str) -> float:
+        return self.ttls.get(mode, self.ttls.get("niche", 0.0))
+
+    def _load(self, key: str) -> Optional[_Entry]:
+        entry = self._lru.get(key)
+        if entry is not None:
+            self._lru.move_to_end(key)
+            return entry
+        if self._db is None:
+            return None
+        row = self._db.execute(
+            "SELECT stored_at, reviews_per_business, max_businesses, payload FROM results WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if not row:
+            return None
+        entry = _Entry(row[0], row[1], row[2], json.loads(row[3]))
+        self._remember(key, entry)
+        return entry
+
+    def _remember(self, key: str, entry: _Entry) -> None:
+        self._lru[key] = entry
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def get(self, request: Any) -> Optional[Tuple[Any, float]]:
+        """(data trimmed to the request, age in seconds) on a fresh covering hit."""
+        ttl = self._ttl(request.mode)
+        if ttl <= 0:
+            return None
+        key = cache_key(request)
+        with self._lock:
+            entry = self._load(key)
+            age = time.time() - entry.stored_at if entry else 0.0
+            if entry is None or age > ttl or not entry.covers(request):
+                self.misses += 1
+                return None
+            self.hits += 1
+        data = trim_result(entry.data, request.mode, request.reviews_per_business, request.max_businesses)
+        return data, age
+
+    def put(self, request: Any, data: Any) -> None:
+        if self._ttl(request.mode) <= 0:
+            return
+        if not data or (isinstance(data, dict) and not data.get("reviews")):
+            return  # empty usually means blocked or timed out; don't pin it
+        key = cache_key(request)
+        entry = _Entry(time.time(), request.reviews_per_business, request.max_businesses, data)
+        with self._lock:
+            self._remember(key, entry)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                    (key, entry.stored_at, entry.reviews_per_business, entry.max_businesses, json.dumps(data)),
+                )
+                self._db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"memory_entries": len(self._lru), "hits": self.hits, "misses": self.misses, "ttl_sec": self.ttls}
@@ -0,0 +1,89 @@
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+# Maps loads review pages from these XHR endpoints; both answer with JSON behind an XSSI guard.
+REVIEW_ENDPOINTS = ("/maps/rpc/listugcposts", "/maps/preview/review/listentitiesreviews")
+
+_XSSI_PREFIX = ")]}'"
+
+
+def is_review_response(url: str) -> bool:
+    return any(endpoint in url for endpoint in REVIEW_ENDPOINTS)
+
+
+def _at(obj: Any, *path: int) -> Any:
+    """obj[p0][p1]..., or None as soon as a level is missing or not a list."""
+    for index in path:
+        if not isinstance(obj, list) or index >= len(obj):
+            return None
+        obj = obj[index]
+    return obj
+
+
+def _iso_from_epoch(value: Any, per_second: int) -> Optional[str]:
+    if not isinstance(value, (int, float)) or value <= 0:
+        return None
+    try:
+        return datetime.fromtimestamp(value / per_second, tz=timezone.utc).isoformat()
+    except (OverflowError, OSError, ValueError):
+        return None
+
+
+def _review(review_id: Any, rating: Any, text: Any, author: Any, relative_time: Any, published_at: Optional[str]) -> Optional[Dict[str, Any]]:
+    if not isinstance(review_id, str) or not review_id:
+        return None
+    if not isinstance(rating, int) or not 1 <= rating <= 5:
+        return None
+    return {
+        "stars": f"{rating} stars",
+        "text": text.strip() if isinstance(text, str) else "",
+        "review_id": review_id,
+        "author": author if isinstance(author, str) else None,
+        "relative_time": relative_time if isinstance(relative_time, str) else None,
+        "published_at": published_at,
+    }
+
+
+def _from_ugc_post(entry: Any) -> Optional[Dict[str, Any]]:
+    """listugcposts: each entry wraps the review as entry[0]; times are microseconds."""
+    r = _at(entry, 0)
+    return _review(
+        _at(r, 0),
+        _at(r, 2, 0, 0),
+        _at(r, 2, 15, 0, 0),
+        _at(r, 1, 4, 5, 0),
+        _at(r, 1, 6),
+        _iso_from_epoch(_at(r, 1, 2), 1_000_000),
+    )
+
+
+def _from_entity_review(r: Any) -> Optional[Dict[str, Any]]:
+    """listentitiesreviews (older payload): flat review arrays; times are milliseconds."""
+    return _review(
+        _at(r, 10),
+        _at(r, 4),
+        _at(r, 3),
+        _at(r, 0, 1),
+        _at(r, 1),
+        _iso_from_epoch(_at(r, 27), 1000),
+    )
+
+
+def decode_review_payload(body: str) -> List[Dict[str, Any]]:
+    """Reviews from one review XHR body, in page order; [] when the layout is not recognised."""
+    raw = body.lstrip()
+    if raw.startswith(_XSSI_PREFIX):
+        raw = raw[len(_XSSI_PREFIX):]
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        return []
+    entries = _at(data, 2)
+    if not isinstance(entries, list):
+        return []
+    for decode in (_from_ugc_post, _from_entity_review):
+        rows = [row for row in (decode(entry) for entry in entries) if row]
+        if rows:
+            return rows
+    return []
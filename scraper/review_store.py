@@ -0,0 +1,59 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Set
+
+
+def _row_id(row: dict) -> str:
+    rid = row.get("review_id")
+    if rid:
+        return str(rid)
+    # Rows from the text-only fallback have no id; key them by content instead.
+    return "text:" + hashlib.sha1((row.get("text") or "").encode("utf-8")).hexdigest()
+
+
+class ReviewStore:
+    """Per-place review history in SQLite, keyed by the Maps place id from the URL."""
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS reviews ("
+            "place_key TEXT, review_id TEXT, place_name TEXT, first_seen REAL, "
+            "position INTEGER, row TEXT, PRIMARY KEY (place_key, review_id))"
+        )
+        self._db.commit()
+
+    @classmethod
+    def from_env(cls) -> "ReviewStore":
+        return cls(os.environ.get("REVIEW_STORE_PATH", "/tmp/leadgap-scraper/reviews.sqlite3"))
+
+    def known_ids(self, place_key: str) -> Set[str]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT review_id FROM reviews WHERE place_key = ?", (place_key,)
+            ).fetchall()
+        return {r[0] for r in rows}
+
+    def merge(self, place_key: str, place_name: str, rows: List[dict]) -> List[dict]:
+        """Insert unseen rows (given newest first) and return the whole history, newest first."""
+        now = time.time()
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR IGNORE INTO reviews VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (place_key, _row_id(row), place_name, now, position, json.dumps(row))
+                    for position, row in enumerate(rows)
+                ],
+            )
+            self._db.commit()
+            stored = self._db.execute(
+                "SELECT row FROM reviews WHERE place_key = ? ORDER BY first_seen DESC, position ASC",
+                (place_key,),
+            ).fetchall()
+        return [json.loads(r[0]) for r in stored]
@@ -1,9 +1,13 @@
 import json
 import os
+import re
 import shutil
 import sys
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 from urllib.parse import quote_plus
 
 from selenium import webdriver
@@ -14,14 +18,25 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 
+from budget import BudgetScheduler
+from consent import preload_consent, save_consent_cookies
+from network import NetworkTap, apply_network_policy, metrics_enabled, tap_or_none
+from review_payload import decode_review_payload
+from stage_timeouts import observe, resolve, script_wait_ceiling, timeout_for
+from target_ranking import candidate_pool_size, rank_targets
+
 
 def eprint(*args: Any, **kwargs: Any) -> None:
     print(*args, file=sys.stderr, **kwargs)
 
 
-def _scrape_budget_deadline() -> float:
+# Receives (business_name, rows) as soon as a business's rows are extracted.
+RowsCallback = Callable[[str, List[dict]], None]
+
+
+def _scrape_budget_deadline(budget_sec: Optional[float] = None) -> float:
     """Wall-clock limit so the API responds before upstream (Vercel) fetch timeout."""
-    sec = float(os.environ.get("SCRAPE_BUDGET_SEC", "78"))
+    sec = budget_sec if budget_sec is not None else float(os.environ.get("SCRAPE_BUDGET_SEC", "78"))
     return time.monotonic() + sec
 
 
@@ -29,43 +44,77 @@ def _over_budget(deadline: float) -> bool:
     return time.monotonic() > deadline
 
 
+def _until(deadline: Optional[float], timeout: float) -> float:
+    """`timeout`, cut to what is left before `deadline` (a place's budget slice), if any."""
+    if deadline is None:
+        return timeout
+    return max(0.0, min(timeout, deadline - time.monotonic()))
+
+
+def _emit_rows(on_rows: Optional[RowsCallback], business_name: str, rows: List[dict]) -> None:
+    if not on_rows or not rows:
+        return
+    try:
+        on_rows(business_name, rows)
+    except Exception as ex:
+        eprint("[scraper] rows callback failed:", ex)
+
+
+def chrome_binary() -> str:
+    return os.environ.get("CHROME_BIN") or shutil.which("chromium") or "/usr/bin/chromium"
+
+
+CHROME_ARGUMENTS = (
+    "--headless=new",
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--window-size=1920,1080",
+    "--lang=en-US",
+    "--disable-extensions",
+    "--blink-settings=imagesEnabled=false",
+    "--disable-background-networking",
+    # Niche scrapes work several tabs at once; keep background tabs at full speed.
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--hide-scrollbars",
+    "--mute-audio",
+    "--no-first-run",
+    "--disable-software-rasterizer",
+    "--disable-blink-features=AutomationControlled",
+    "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+)
+
+
 def _chrome_options() -> Options:
-    chrome_bin = os.environ.get("CHROME_BIN") or shutil.which("chromium") or "/usr/bin/chromium"
     chrome_options = Options()
-    chrome_options.binary_location = chrome_bin
+    chrome_options.binary_location = chrome_binary()
     chrome_options.page_load_strategy = "normal"
     chrome_options.add_experimental_option(
         "prefs", {"intl.accept_languages": "en,en_US"}
     )
-    for arg in (
-        "--headless=new",
-        "--no-sandbox",
-        "--disable-setuid-sandbox",
-        "--disable-dev-shm-usage",
-        "--disable-gpu",
-        "--window-size=1920,1080",
-        "--lang=en-US",
-        "--disable-extensions",
-        "--blink-settings=imagesEnabled=false",
-        "--disable-background-networking",
-        "--disable-default-apps",
-        "--disable-sync",
-        "--disable-translate",
-        "--hide-scrollbars",
-        "--mute-audio",
-        "--no-first-run",
-        "--disable-software-rasterizer",
-        "--disable-blink-features=AutomationControlled",
-        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-    ):
+    for arg in CHROME_ARGUMENTS:
         chrome_options.add_argument(arg)
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    _enable_network_log(chrome_options)
     return chrome_options
 
 
-def get_driver():
-    chrome_options = _chrome_options()
+def _enable_network_log(chrome_options: Options) -> None:
+    """Have chromedriver buffer CDP Network events so scrapes can count bytes."""
+    if not metrics_enabled():
+        return
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    chrome_options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
+
+def _driver_services() -> List[Any]:
     driver_bin = os.environ.get("CHROMEDRIVER_PATH") or shutil.which("chromedriver") or "/usr/bin/chromedriver"
 
     attempts = []
@@ -74,14 +123,22 @@ def get_driver():
 
     # Selenium Manager can download a driver matched to the Chromium binary.
     attempts.append(("selenium-manager", Service()))
+    return attempts
+
 
+def get_driver(chrome_options: Optional[Options] = None):
+    chrome_options = chrome_options or _chrome_options()
     last_error = None
-    for label, service in attempts:
+    for label, service in _driver_services():
         try:
-            eprint(f"[scraper] starting Chrome via {label} (driver={getattr(service, 'path', driver_bin)})")
+            eprint(f"[scraper] starting Chrome via {label} (driver={getattr(service, 'path', '?')})")
             driver = webdriver.Chrome(service=service, options=chrome_options)
             driver.set_page_load_timeout(int(os.environ.get("PAGE_LOAD_TIMEOUT_SEC", "25")))
             driver.set_script_timeout(int(os.environ.get("SCRIPT_TIMEOUT_SEC", "20")))
+            if not chrome_options.debugger_address:
+                # Attached sessions start on someone else's tab; the caller applies these after switching.
+                apply_network_policy(driver)
+                preload_consent(driver)
             return driver
         except WebDriverException as e:
             last_error = e
@@ -91,9 +148,51 @@ def get_driver():
     raise WebDriverException(f"Chrome could not start: {last_error}")
 
 
-def filter_reviews(reviews: List[dict], min_word_count: int = 3) -> List[dict]:
+def attach_driver(debugger_address: str):
+    """New chromedriver session on an already running Chromium (shared-browser mode)."""
+    chrome_options = Options()
+    chrome_options.debugger_address = debugger_address
+    _enable_network_log(chrome_options)
+    return get_driver(chrome_options)
+
+
+@contextmanager
+def _driver_session(driver=None) -> Iterator[Any]:
+    """Use a caller-owned driver (e.g. from the pool) or launch a throwaway one."""
+    if driver is not None:
+        yield driver
+        return
+    own = get_driver()
+    try:
+        yield own
+    finally:
+        own.quit()
+
+
+@contextmanager
+def _scrape_report(driver, report: Optional[Dict[str, Any]]) -> Iterator[Optional[NetworkTap]]:
+    """Fill `report` with elapsed time and this scrape's network counters on the way out."""
+    tap = tap_or_none(driver)
+    started = time.monotonic()
+    try:
+        yield tap
+    finally:
+        network = tap.summary() if tap is not None else None
+        if report is not None:
+            report["elapsed_ms"] = int((time.monotonic() - started) * 1000)
+            if network is not None:
+                report["network"] = network
+
+
+def filter_reviews(
+    reviews: List[dict], min_word_count: int = 3, seen_texts: Optional[Set[str]] = None
+) -> List[dict]:
+    """Drop reviews without text, under `min_word_count` words, or already in `seen_texts`.
+
+    Pass the same `seen_texts` across calls to dedupe over several batches.
+    """
     unique_reviews = []
-    seen_texts = set()
+    seen_texts = set() if seen_texts is None else seen_texts
     for review in reviews:
         review_text = review.get("text")
         if not review_text or review_text in seen_texts:
@@ -105,6 +204,26 @@ def filter_reviews(reviews: List[dict], min_word_count: int = 3) -> List[dict]:
     return unique_reviews
 
 
+def _filtered_rows(on_rows: Optional[RowsCallback], cap: Optional[int]) -> Optional[RowsCallback]:
+    """Wrap `on_rows` so streamed rows match the final result: filter_reviews over the
+    whole scrape, then at most `cap` rows in total (None: no cap)."""
+    if on_rows is None:
+        return None
+    seen_texts: Set[str] = set()
+    sent = 0
+
+    def emit(business_name: str, rows: List[dict]) -> None:
+        nonlocal sent
+        rows = filter_reviews(rows, seen_texts=seen_texts)
+        if cap is not None:
+            rows = rows[: max(0, cap - sent)]
+        sent += len(rows)
+        if rows:
+            on_rows(business_name, rows)
+
+    return emit
+
+
 def _maps_search_url(search_query: str, location: Optional[str]) -> str:
     parts = [search_query.strip()]
     if location and str(location).strip() and str(location).strip().lower() != "unknown location":
@@ -113,34 +232,256 @@ def _maps_search_url(search_query: str, location: Optional[str]) -> str:
     return "https://www.google.com/maps/search/" + quote_plus(q)
 
 
-def dismiss_cookie_consent(driver) -> None:
-    short_wait = WebDriverWait(driver, 2)
-    attempts = [
-        (By.CSS_SELECTOR, "button[aria-label*='Reject']"),
-        (By.CSS_SELECTOR, "button[aria-label*='reject']"),
-        (By.XPATH, "//button[contains(., 'Reject all')]"),
-        (By.XPATH, "//button[contains(., 'Accept all')]"),
-        (By.CSS_SELECTOR, "[aria-modal='true'] button"),
-    ]
-    for by, sel in attempts:
+_WAIT_FOR_DOM_SCRIPT = """
+const args = arguments[0];
+const timeoutMs = arguments[1];
+const done = arguments[arguments.length - 1];
+const ready = __PREDICATE__;
+function check() {
+  try { return !!ready(args); } catch (e) { return false; }
+}
+if (check()) { done(true); return; }
+let finished = false;
+const observer = new MutationObserver(() => { if (check()) finish(true); });
+// URL and scroll changes are not DOM mutations, so also poll cheaply.
+const poll = setInterval(() => { if (check()) finish(true); }, 100);
+const timer = setTimeout(() => finish(check()), timeoutMs);
+function finish(ok) {
+  if (finished) return;
+  finished = true;
+  observer.disconnect();
+  clearInterval(poll);
+  clearTimeout(timer);
+  done(ok);
+}
+observer.observe(document.documentElement || document, { childList: true, subtree: true, attributes: true });
+"""
+
+_SCROLL_AND_WAIT_SCRIPT = """
+const el = arguments[0];
+const selector = arguments[1];
+const timeoutMs = arguments[2];
+const done = arguments[arguments.length - 1];
+const count = () => el.querySelectorAll(selector).length;
+const before = count();
+el.scrollTop = el.scrollHeight;
+let finished = false;
+const grew = () => count() > before;
+const observer = new MutationObserver(() => { if (grew()) finish(true); });
+const timer = setTimeout(() => finish(grew()), timeoutMs);
+function finish(ok) {
+  if (finished) return;
+  finished = true;
+  observer.disconnect();
+  clearTimeout(timer);
+  done(ok);
+}
+observer.observe(el, { childList: true, subtree: true });
+"""
+
+# Readiness predicates for wait_for_dom; each receives the extra args as an array.
+_PAGE_SETTLED_JS = (
+    "(a) => document.readyState === 'complete' && !!document.querySelector("
+    "\"div[role='feed'], div[role='article'], div[role='main'], h1, form\")"
+)
+_SELECTOR_PRESENT_JS = "(a) => !!document.querySelector(a[0])"
+_SELECTOR_ABSENT_JS = "(a) => !document.querySelector(a[0])"
+_COUNT_ABOVE_JS = "(a) => document.querySelectorAll(a[0]).length > a[1]"
+_PLACE_OPENED_JS = (
+    "(a) => location.href.includes('/maps/place/') && "
+    "!!document.querySelector('h1.DUwDvf, h1.fontHeadlineLarge')"
+)
+_IN_VIEWPORT_JS = (
+    "(a) => { const r = a[0].getBoundingClientRect(); "
+    "return r.top >= 0 && r.bottom <= window.innerHeight; }"
+)
+
+
+def wait_for_dom(driver, predicate_js: str, timeout: float, *args: Any) -> bool:
+    """Resolve as soon as an in-page predicate holds (MutationObserver), else after `timeout`.
+
+    `timeout` is the ceiling that used to be a fixed sleep; ready pages don't wait at all.
+    """
+    if timeout <= 0:
+        return False
+    script = _WAIT_FOR_DOM_SCRIPT.replace("__PREDICATE__", predicate_js)
+    try:
+        return bool(driver.execute_async_script(script, list(args), int(timeout * 1000)))
+    except Exception:
+        return False
+
+
+def scroll_and_wait(driver, element, selector: str, timeout: float) -> bool:
+    """Scroll a container to its bottom and wait (up to `timeout`) for more `selector` cards in it.
+
+    Only a higher card count ends the wait early; spinners, avatars and other
+    DOM churn under the container do not.
+    """
+    if timeout <= 0:
+        return False
+    try:
+        return bool(driver.execute_async_script(
+            _SCROLL_AND_WAIT_SCRIPT, element, selector, int(timeout * 1000)
+        ))
+    except Exception:
+        return False
+
+
+_WAIT_FOR_FIRST_SCRIPT = """
+const candidates = arguments[0];
+const timeoutMs = arguments[1];
+const visibleOnly = arguments[2];
+const excludeTexts = arguments[3];
+const done = arguments[arguments.length - 1];
+function nodes(kind, selector) {
+  if (kind !== 'xpath') return document.querySelectorAll(selector);
+  const snap = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+  const out = [];
+  for (let i = 0; i < snap.snapshotLength; i++) out.push(snap.snapshotItem(i));
+  return out;
+}
+function check() {
+  for (let i = 0; i < candidates.length; i++) {
+    try {
+      for (const el of nodes(candidates[i][0], candidates[i][1])) {
+        if (visibleOnly && (!el.getClientRects().length || el.disabled)) continue;
+        const text = (el.innerText || '').trim();
+        if (excludeTexts.length && excludeTexts.includes(text.toLowerCase())) continue;
+        return { index: i, element: el, text: text };
+      }
+    } catch (e) {}
+  }
+  return null;
+}
+const first = check();
+if (first) { done(first); return; }
+let finished = false;
+const observer = new MutationObserver(() => { const hit = check(); if (hit) finish(hit); });
+const poll = setInterval(() => { const hit = check(); if (hit) finish(hit); }, 100);
+const timer = setTimeout(() => finish(check()), timeoutMs);
+function finish(hit) {
+  if (finished) return;
+  finished = true;
+  observer.disconnect();
+  clearInterval(poll);
+  clearTimeout(timer);
+  done(hit);
+}
+observer.observe(document.documentElement || document, { childList: true, subtree: true, attributes: true });
+"""
+
+# Selector -> times it won, per chain; misses per chain.
+_selector_hits: Dict[str, Dict[str, int]] = {}
+_selector_misses: Dict[str, int] = {}
+_selector_lock = threading.Lock()
+
+
+def wait_for_first(
+    driver,
+    chain: str,
+    candidates: Sequence[Tuple[str, str]],
+    timeout: float,
+    visible: bool = True,
+    exclude_texts: Sequence[str] = (),
+) -> Optional[Dict[str, Any]]:
+    """Wait for whichever of several ("css"|"xpath", selector) candidates matches first.
+
+    All candidates are watched by one in-page observer, so a miss costs `timeout`
+    once rather than per selector. Candidates are checked in order of past wins for
+    `chain`. Returns {"selector", "element", "text"} for the winner, or None.
+    """
+    with _selector_lock:
+        hits = dict(_selector_hits.get(chain, {}))
+    ordered = sorted(candidates, key=lambda c: -hits.get(c[1], 0))
+    # A wait the script timeout cuts off would read as a miss at the full timeout.
+    timeout = min(timeout, script_wait_ceiling())
+    found = None
+    if timeout > 0:
         try:
-            btn = short_wait.until(EC.element_to_be_clickable((by, sel)))
-            btn.click()
-            time.sleep(0.4)
-            return
+            found = driver.execute_async_script(
+                _WAIT_FOR_FIRST_SCRIPT,
+                [list(c) for c in ordered],
+                int(timeout * 1000),
+                visible,
+                [t.lower() for t in exclude_texts],
+            )
         except Exception:
-            continue
+            found = None
+    with _selector_lock:
+        if not found:
+            _selector_misses[chain] = _selector_misses.get(chain, 0) + 1
+            return None
+        selector = ordered[int(found["index"])][1]
+        chain_hits = _selector_hits.setdefault(chain, {})
+        chain_hits[selector] = chain_hits.get(selector, 0) + 1
+    return {"selector": selector, "element": found.get("element"), "text": found.get("text") or ""}
+
+
+def selector_stats() -> Dict[str, Any]:
+    """Per-chain wins by selector and misses, as used to order `wait_for_first` candidates."""
+    with _selector_lock:
+        return {
+            chain: {"hits": dict(_selector_hits.get(chain, {})), "misses": _selector_misses.get(chain, 0)}
+            for chain in sorted(set(_selector_hits) | set(_selector_misses))
+        }
+
+
+def _count_nodes(driver, css: str) -> int:
+    try:
+        return int(driver.execute_script("return document.querySelectorAll(arguments[0]).length", css) or 0)
+    except Exception:
+        return 0
+
+
+_CONSENT_SCRIPT = """
+const onConsentPage = location.hostname.startsWith('consent.');
+const dialog = document.querySelector("form[action*='consent'], [aria-modal='true']");
+if (!onConsentPage && !dialog) return { found: false };
+const scope = onConsentPage ? document : (dialog.closest("[aria-modal='true']") || dialog);
+const label = (b) => ((b.getAttribute('aria-label') || '') + ' ' + (b.innerText || b.value || '')).trim();
+const buttons = Array.from(scope.querySelectorAll("button, input[type='submit']"));
+const pick = buttons.find((b) => /reject all/i.test(label(b)))
+  || buttons.find((b) => /reject/i.test(label(b)))
+  || buttons.find((b) => /accept all/i.test(label(b)));
+// An aria-modal without consent buttons is some other Maps dialog; leave it alone.
+if (!pick) return { found: onConsentPage || !!document.querySelector("form[action*='consent']"), clicked: false };
+pick.click();
+return { found: true, clicked: true, label: label(pick) };
+"""
+
+
+def dismiss_cookie_consent(driver) -> bool:
+    """Answer Google's consent dialog in one in-page check; returns True when one was dismissed.
+
+    The resulting consent cookies are saved so later drivers start with them.
+    """
+    try:
+        state = driver.execute_script(_CONSENT_SCRIPT) or {}
+    except Exception as ex:
+        eprint("[scraper] consent check failed:", ex)
+        return False
+    if not state.get("found"):
+        return False
+    if not state.get("clicked"):
+        eprint("[scraper] consent dialog without a known button")
+        return False
+    eprint("[scraper] consent dismissed via:", state.get("label"))
+    wait_for_dom(driver, _SELECTOR_ABSENT_JS, 3.0, "[aria-modal='true'], form[action*='consent']")
+    if "consent." in driver.current_url:
+        wait_for_dom(driver, _PAGE_SETTLED_JS, 3.0)
+    save_consent_cookies(driver)
+    return True
+
+
+# One result listing in the search feed.
+FEED_CARD_CSS = "div[role='article']"
 
 
 def scroll_results_feed(driver, rounds: int = 4) -> None:
     try:
         feed = driver.find_element(By.CSS_SELECTOR, "div[role='feed']")
         for _ in range(rounds):
-            driver.execute_script(
-                "arguments[0].scrollTop = arguments[0].scrollHeight",
-                feed,
-            )
-            time.sleep(0.22)
+            scroll_and_wait(driver, feed, FEED_CARD_CSS, 0.22)
     except Exception as ex:
         eprint("[scraper] feed scroll skipped:", ex)
 
@@ -154,21 +495,54 @@ def _listing_link_selectors():
 
 def safe_get(driver, url: str, wait_after: float = 1.0) -> bool:
     """Navigate without failing the whole scrape on renderer timeouts."""
+    timeout = timeout_for("page_load")
+    started = time.monotonic()
     try:
-        driver.set_page_load_timeout(int(os.environ.get("PAGE_LOAD_TIMEOUT_SEC", "45")))
+        driver.set_page_load_timeout(timeout)
         driver.get(url)
-        time.sleep(wait_after)
+        observe("page_load", started, True, timeout)
+        wait_for_dom(driver, _PAGE_SETTLED_JS, wait_after)
         return True
     except TimeoutException:
+        observe("page_load", started, False, timeout)
         eprint("[scraper] page load timeout (continuing):", url[:140])
         try:
             driver.execute_script("window.stop();")
         except Exception:
             pass
-        time.sleep(wait_after)
+        wait_for_dom(driver, _PAGE_SETTLED_JS, wait_after)
         return False
 
 
+def place_key_from_url(url: str) -> str:
+    """Stable id for a Maps place: feature id (0x..:0x..), else Place ID, else the URL name."""
+    for pattern in (r"!1s(0x[0-9a-fA-F]+:0x[0-9a-fA-F]+)", r"!19s(ChIJ[\w-]+)"):
+        match = re.search(pattern, url or "")
+        if match:
+            return match.group(1)
+    return place_name_from_url(url or "").lower()
+
+
+def reviews_url(place_url: str) -> Optional[str]:
+    """Deep link that opens a place straight on its reviews list (`!9m1!1b1`).
+
+    Built from the feature id and coordinates in a feed link; None when the
+    link carries no feature id.
+    """
+    fid = re.search(r"!1s(0x[0-9a-fA-F]+:0x[0-9a-fA-F]+)", place_url or "")
+    if not fid:
+        return None
+    name = re.search(r"/place/([^/@?]+)", place_url)
+    coords = re.search(r"!3d(-?\d+(?:\.\d+)?)!4d(-?\d+(?:\.\d+)?)", place_url)
+    if coords:
+        data = f"!4m7!3m6!1s{fid.group(1)}!8m2!3d{coords.group(1)}!4d{coords.group(2)}!9m1!1b1"
+    else:
+        data = f"!4m4!3m3!1s{fid.group(1)}!9m1!1b1"
+    query = place_url.split("?", 1)[1] if "?" in place_url else ""
+    url = f"https://www.google.com/maps/place/{name.group(1) if name else '_'}/data={data}"
+    return f"{url}?{query}" if query else url
+
+
 def place_name_from_url(url: str) -> str:
     import re
     from urllib.parse import unquote
@@ -179,22 +553,19 @@ def place_name_from_url(url: str) -> str:
     return unquote(match.group(1).replace("+", " ")).strip()
 
 
-def wait_for_place_panel(driver, timeout: float = 12.0) -> str:
-    deadline = time.monotonic() + timeout
-    invalid_names = {"results", "google maps", ""}
+PLACE_TITLE_CANDIDATES = (("css", "h1.DUwDvf"), ("css", "h1.fontHeadlineLarge"), ("css", "h1"))
 
-    while time.monotonic() < deadline:
-        for css in ("h1.DUwDvf", "h1.fontHeadlineLarge", "h1"):
-            try:
-                for h1 in driver.find_elements(By.CSS_SELECTOR, css):
-                    text = (h1.text or "").strip()
-                    if text.lower() not in invalid_names:
-                        return text
-            except Exception:
-                continue
-        time.sleep(0.4)
 
-    return place_name_from_url(driver.current_url)
+def wait_for_place_panel(driver, timeout: float = 12.0) -> str:
+    hit = wait_for_first(
+        driver,
+        "place_title",
+        PLACE_TITLE_CANDIDATES,
+        timeout,
+        visible=False,
+        exclude_texts=("results", "google maps", ""),
+    )
+    return (hit["text"] if hit else "") or place_name_from_url(driver.current_url)
 
 
 def open_place_by_index(driver, index: int) -> Optional[str]:
@@ -210,15 +581,18 @@ def open_place_by_index(driver, index: int) -> Optional[str]:
         try:
             link_el = article.find_element(By.CSS_SELECTOR, css)
             driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", link_el)
-            time.sleep(0.35)
+            wait_for_dom(driver, _IN_VIEWPORT_JS, 0.35, link_el)
             link_el.click()
-            time.sleep(2.0)
+            wait_for_dom(driver, _PLACE_OPENED_JS, 2.0)
             return name or wait_for_place_panel(driver) or None
         except Exception:
             continue
     return None
 
 
+RESULTS_FEED_CANDIDATES = (("css", "div[role='feed']"), ("css", "div[role='article']"))
+
+
 def load_search_results(driver, search_query: str, location: Optional[str]) -> bool:
     url = _maps_search_url(search_query, location)
     eprint("[scraper] niche maps URL:", url)
@@ -233,34 +607,78 @@ def load_search_results(driver, search_query: str, location: Optional[str]) -> b
     if "/maps/place/" in driver.current_url:
         return True
 
-    for css in ("div[role='feed']", "div[role='article']"):
-        try:
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, css))
-            )
-            time.sleep(0.6)
-            return True
-        except TimeoutException:
-            continue
+    timeout = timeout_for("results_feed")
+    started = time.monotonic()
+    feed = wait_for_first(driver, "results_feed", RESULTS_FEED_CANDIDATES, timeout, visible=False)
+    observe("results_feed", started, feed is not None, timeout)
+    if feed:
+        wait_for_dom(driver, _SELECTOR_PRESENT_JS, 0.6, "div[role='article']")
+        return True
 
     reason = _page_block_reason(driver) or "results_feed_timeout"
     eprint("[scraper] timeout waiting for results feed/articles:", reason)
     return False
 
 
-def _page_block_reason(driver) -> Optional[str]:
+_PAGE_STATE_SCRIPT = """
+const href = location.href;
+const title = (document.title || '').trim().toLowerCase();
+if (href.includes('/sorry/')) return { verdict: 'captcha', signal: 'url_sorry' };
+if (document.querySelector('#captcha-form, form[action*="sorry"], iframe[src*="recaptcha"], div.g-recaptcha')) {
+  return { verdict: 'captcha', signal: 'captcha_element' };
+}
+if (location.hostname.startsWith('consent.')) return { verdict: 'consent_wall', signal: 'url_consent' };
+if (document.querySelector('form[action*="consent.google"]')) {
+  return { verdict: 'consent_wall', signal: 'consent_form' };
+}
+const hasFeed = !!document.querySelector('[role="feed"]');
+const hasMapsUi = hasFeed || !!document.querySelector('[role="main"]');
+// Interstitials replace the Maps UI, so only pay for innerText when it is missing.
+if (!hasMapsUi && document.body) {
+  const text = (document.body.innerText || '').toLowerCase();
+  if (text.includes('unusual traffic')) return { verdict: 'captcha', signal: 'text_unusual_traffic' };
+  if (text.includes('before you continue')) return { verdict: 'consent_wall', signal: 'text_before_you_continue' };
+}
+if ((title === 'google maps' || title === '') && !hasFeed && !href.includes('/maps/place/')) {
+  return { verdict: 'not_loaded', signal: title ? 'title_without_feed' : 'empty_title' };
+}
+return { verdict: 'ok', signal: hasFeed ? 'feed' : 'maps_ui' };
+"""
+
+_BLOCK_REASONS = {
+    "captcha": "google_captcha",
+    "consent_wall": "google_consent_wall",
+    "not_loaded": "maps_not_loaded",
+}
+_page_state_counts: Dict[str, int] = {}
+_page_state_lock = threading.Lock()
+
+
+def detect_page_state(driver) -> Dict[str, str]:
+    """Compact in-page verdict (captcha, consent_wall, not_loaded, ok) and the signal that fired."""
     try:
-        src = (driver.page_source or "").lower()
-        title = (driver.title or "").lower()
+        state = driver.execute_script(_PAGE_STATE_SCRIPT) or {}
     except Exception:
-        return None
-    if "unusual traffic" in src or "captcha" in src or "/sorry/" in driver.current_url:
-        return "google_captcha"
-    if "before you continue" in src or "consent.google" in driver.current_url:
-        return "google_consent_wall"
-    if title in ("google maps", "") and "role=\"feed\"" not in src and "/maps/place/" not in driver.current_url:
-        return "maps_not_loaded"
-    return None
+        return {"verdict": "unknown", "signal": "script_error"}
+    verdict = str(state.get("verdict") or "unknown")
+    signal = str(state.get("signal") or "")
+    with _page_state_lock:
+        key = f"{verdict}:{signal}"
+        _page_state_counts[key] = _page_state_counts.get(key, 0) + 1
+    return {"verdict": verdict, "signal": signal}
+
+
+def page_state_counts() -> Dict[str, int]:
+    with _page_state_lock:
+        return dict(_page_state_counts)
+
+
+def _page_block_reason(driver) -> Optional[str]:
+    state = detect_page_state(driver)
+    reason = _BLOCK_REASONS.get(state["verdict"])
+    if reason:
+        eprint(f"[scraper] page state {state['verdict']} via {state['signal']}")
+    return reason
 
 
 def _parse_star_value(star_aria: str) -> Optional[float]:
@@ -274,25 +692,34 @@ def _parse_star_value(star_aria: str) -> Optional[float]:
     return None
 
 
-def scroll_reviews_panel(driver, rounds: int = 6) -> None:
-    selectors = (
-        "div[role='main'] div.m6QErb.DxyBCb",
-        "div[role='main'] div.m6QErb",
-        "div[role='main'] div[tabindex='-1']",
-        "div[role='main']",
-    )
-    for css in selectors:
-        try:
-            panel = driver.find_element(By.CSS_SELECTOR, css)
-            for _ in range(rounds):
-                driver.execute_script(
-                    "arguments[0].scrollTop = arguments[0].scrollHeight",
-                    panel,
-                )
-                time.sleep(0.45)
+REVIEW_PANEL_SELECTORS = (
+    "div[role='main'] div.m6QErb.DxyBCb",
+    "div[role='main'] div.m6QErb",
+    "div[role='main'] div[tabindex='-1']",
+    "div[role='main']",
+)
+
+
+def _reviews_panel(driver):
+    """The scrollable container of the open reviews list, or None."""
+    for css in REVIEW_PANEL_SELECTORS:
+        found = driver.find_elements(By.CSS_SELECTOR, css)
+        if found:
+            return found[0]
+    return None
+
+
+def scroll_reviews_panel(driver, rounds: int = 6, deadline: Optional[float] = None) -> None:
+    try:
+        panel = _reviews_panel(driver)
+        if panel is None:
             return
-        except Exception:
-            continue
+        for _ in range(rounds):
+            if deadline is not None and _over_budget(deadline):
+                return
+            scroll_and_wait(driver, panel, REVIEW_READY_CSS, _until(deadline, 0.45))
+    except Exception:
+        pass
 
 
 REVIEW_BLOCK_SELECTORS = (
@@ -302,42 +729,40 @@ REVIEW_BLOCK_SELECTORS = (
     "div.UfnAi",
     "[data-review-id]",
 )
+REVIEW_READY_CSS = ", ".join(REVIEW_BLOCK_SELECTORS + ("span.wiI7pd", "div.wiI7pd", "div.MyEned"))
 
 
-def wait_for_review_elements(driver, timeout: float = 18.0) -> bool:
-    def _any_reviews_present(drv) -> bool:
-        for css in REVIEW_BLOCK_SELECTORS + ("span.wiI7pd", "div.wiI7pd", "div.MyEned"):
-            if drv.find_elements(By.CSS_SELECTOR, css):
-                return True
-        return False
+def wait_for_review_elements(driver, timeout: Optional[float] = None) -> bool:
+    """Wait for the first review cards; without `timeout` the stage's learned timeout is used."""
+    candidates = [("css", css) for css in REVIEW_BLOCK_SELECTORS + ("span.wiI7pd", "div.wiI7pd", "div.MyEned")]
+    timeout, adaptive = resolve("review_cards", timeout)
+    started = time.monotonic()
+    ok = wait_for_first(driver, "review_cards", candidates, timeout, visible=False) is not None
+    observe("review_cards", started, ok, timeout, adaptive)
+    return ok
 
+
+MORE_REVIEWS_CANDIDATES = (
+    ("xpath", "//button[contains(., 'More reviews')]"),
+    ("xpath", "//span[contains(., 'More reviews')]"),
+    ("xpath", "//button[contains(@aria-label, 'More reviews')]"),
+    ("xpath", "//a[contains(@href, 'reviews')]"),
+)
+
+
+def expand_reviews_list(driver, timeout: float = 2.0, deadline: Optional[float] = None) -> bool:
+    hit = wait_for_first(driver, "more_reviews", MORE_REVIEWS_CANDIDATES, _until(deadline, timeout))
+    if not hit:
+        return False
     try:
-        WebDriverWait(driver, timeout).until(_any_reviews_present)
+        cards_before = _count_nodes(driver, REVIEW_READY_CSS)
+        hit["element"].click()
+        wait_for_dom(driver, _COUNT_ABOVE_JS, _until(deadline, 1.5), REVIEW_READY_CSS, cards_before)
         return True
-    except TimeoutException:
+    except Exception:
         return False
 
 
-def expand_reviews_list(driver) -> bool:
-    xpaths = (
-        "//button[contains(., 'More reviews')]",
-        "//span[contains(., 'More reviews')]",
-        "//button[contains(@aria-label, 'More reviews')]",
-        "//a[contains(@href, 'reviews')]",
-    )
-    for xpath in xpaths:
-        try:
-            btn = WebDriverWait(driver, 2).until(
-                EC.element_to_be_clickable((By.XPATH, xpath))
-            )
-            btn.click()
-            time.sleep(1.5)
-            return True
-        except Exception:
-            continue
-    return False
-
-
 def extract_reviews_js(driver, limit: int, business_name: str) -> List[dict]:
     script = """
     const limit = arguments[0];
@@ -359,11 +784,11 @@ def extract_reviews_js(driver, limit: int, business_name: str) -> List[dict]:
       'div.MyEned',
     ];
 
-    function addRow(text, stars) {
+    function addRow(text, stars, reviewId) {
       const t = (text || '').replace(/\\s+/g, ' ').trim();
       if (t.length < 12 || seen.has(t)) return;
       seen.add(t);
-      out.push({ business_name: businessName, stars: stars || 'unknown', text: t });
+      out.push({ business_name: businessName, stars: stars || 'unknown', text: t, review_id: reviewId || null });
     }
 
     for (const cardSel of cardSelectors) {
@@ -378,7 +803,12 @@ def extract_reviews_js(driver, limit: int, business_name: str) -> List[dict]:
         let stars = 'unknown';
         const starEl = card.querySelector('[aria-label*="star" i], [aria-label*="Star"]');
         if (starEl) stars = starEl.getAttribute('aria-label') || stars;
-        addRow(text, stars);
+        let reviewId = card.getAttribute('data-review-id');
+        if (!reviewId) {
+          const idEl = card.querySelector('[data-review-id]');
+          if (idEl) reviewId = idEl.getAttribute('data-review-id');
+        }
+        addRow(text, stars, reviewId);
       }
     }
 
@@ -399,72 +829,299 @@ def extract_reviews_js(driver, limit: int, business_name: str) -> List[dict]:
         return []
 
 
-def collect_place_targets(driver, max_businesses: int) -> List[Dict[str, str]]:
-    targets: List[Dict[str, str]] = []
-    seen_urls = set()
+_FEED_TARGETS_SCRIPT = """
+const linkSelectors = arguments[0];
+const feed = document.querySelector("div[role='feed']");
+const targets = [];
+const seen = new Set();
+function add(link, name, meta) {
+  if (!link || !link.includes('/maps/place/') || seen.has(link)) return;
+  seen.add(link);
+  targets.push(Object.assign({ name: name || link, link: link }, meta || {}));
+}
+function cardMeta(card) {
+  const ratingEl = card.querySelector('span.MW4etd');
+  const countEl = card.querySelector('span.UY7F9');
+  const starsEl = card.querySelector("span[role='img'][aria-label]");
+  let category = '';
+  for (const line of card.querySelectorAll('div.W4Efsd')) {
+    if (line.querySelector('div.W4Efsd')) continue;  // wrapper around the info lines
+    const parts = (line.innerText || '').split('·').map((p) => p.trim()).filter(Boolean);
+    // The rating line starts with a digit ("4.8(1,234) · $$") or "No reviews".
+    if (parts.length && !/^[\d(]/.test(parts[0]) && !/review/i.test(parts[0]) && !parts[0].includes('$')) {
+      category = parts[0];
+      break;
+    }
+  }
+  return {
+    rating_text: ratingEl ? ratingEl.innerText : '',
+    count_text: countEl ? countEl.innerText : '',
+    stars_label: starsEl ? (starsEl.getAttribute('aria-label') || '') : '',
+    category: category,
+  };
+}
+for (const article of document.querySelectorAll("div[role='article']")) {
+  let link = '';
+  for (const sel of linkSelectors) {
+    const a = article.querySelector(sel);
+    if (a && (a.href || '').includes('/maps/place/')) { link = a.href; break; }
+  }
+  add(link, (article.getAttribute('aria-label') || '').trim(), cardMeta(article));
+}
+if (feed) {
+  for (const a of feed.querySelectorAll("a[href*='/maps/place/']")) {
+    add(a.href, (a.getAttribute('aria-label') || a.innerText || '').trim());
+  }
+}
+const tail = feed && feed.lastElementChild ? (feed.lastElementChild.innerText || '') : '';
+const ended = !!document.querySelector('span.HlvSq') || /end of the list/i.test(tail);
+return { targets: targets, ended: ended, has_feed: !!feed };
+"""
+
+
+def _parse_count(text: str) -> Optional[int]:
+    digits = re.sub(r"[^\d]", "", text or "")
+    return int(digits) if digits else None
+
+
+def _card_metadata(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Rating and review count from a feed card's spans, else from its "4.5 stars 1,234 Reviews" label."""
+    label = raw.get("stars_label") or ""
+    rating = _parse_star_value(raw.get("rating_text") or "")
+    if rating is None:
+        rating = _parse_star_value(label)
+    count = _parse_count(raw.get("count_text") or "")
+    if count is None:
+        match = re.search(r"([\d.,]+)\s+review", label, re.IGNORECASE)
+        count = _parse_count(match.group(1)) if match else None
+    return {
+        "name": raw.get("name") or raw.get("link", ""),
+        "link": raw.get("link", ""),
+        "rating": rating,
+        "review_count": count,
+        "category": raw.get("category") or None,
+    }
 
-    scroll_results_feed(driver)
 
-    articles = driver.find_elements(By.CSS_SELECTOR, "div[role='article']")
-    for biz in articles:
+def collect_place_targets(driver, max_businesses: int) -> List[Dict[str, Any]]:
+    """Page through the results feed until `max_businesses` distinct places or the end of the list.
+
+    Every round reads all cards in one script call; the feed is only scrolled
+    while more places are needed, up to FEED_MAX_ROUNDS (Maps lists ~120 results).
+    Each target carries the card's name, link, rating, review_count and category.
+    """
+    max_rounds = int(os.environ.get("FEED_MAX_ROUNDS", "40"))
+    feeds = driver.find_elements(By.CSS_SELECTOR, "div[role='feed']")
+    targets: List[Dict[str, str]] = []
+    wait = 0.3
+    stalled = 0
+    rounds = 0
+    stop = "max_rounds"
+    while True:
+        try:
+            found = driver.execute_script(_FEED_TARGETS_SCRIPT, _listing_link_selectors()) or {}
+        except Exception as ex:
+            eprint("[scraper] feed read failed:", ex)
+            stop = "error"
+            break
+        grew = len(found.get("targets") or []) > len(targets)
+        targets = found.get("targets") or targets
         if len(targets) >= max_businesses:
+            stop = "enough"
             break
-        name = (biz.get_attribute("aria-label") or "").strip()
-        link = ""
-        for css in _listing_link_selectors():
-            try:
-                link_el = biz.find_element(By.CSS_SELECTOR, css)
-                link = (link_el.get_attribute("href") or "").strip()
-                if "/maps/place/" in link:
-                    break
-            except Exception:
-                continue
-        if link and "/maps/place/" in link and link not in seen_urls:
-            seen_urls.add(link)
-            targets.append({"name": name or link, "link": link})
-
-    if len(targets) < max_businesses:
+        if found.get("ended"):
+            stop = "end_of_list"
+            break
+        if not feeds:
+            stop = "no_feed"
+            break
+        if rounds >= max_rounds:
+            break
+        if grew:
+            stalled = 0
+            wait = 0.3
+        else:
+            stalled += 1
+            if stalled >= 3:
+                stop = "stalled"
+                break
+            wait = min(wait * 2, 2.0)
         try:
-            feed_links = driver.find_elements(
-                By.CSS_SELECTOR, "div[role='feed'] a[href*='/maps/place/']"
-            )
-            for a in feed_links:
-                if len(targets) >= max_businesses:
-                    break
-                link = (a.get_attribute("href") or "").strip()
-                if not link or link in seen_urls:
-                    continue
-                seen_urls.add(link)
-                label = (a.get_attribute("aria-label") or a.text or link).strip()
-                targets.append({"name": label, "link": link})
+            scroll_and_wait(driver, feeds[0], FEED_CARD_CSS, wait)
         except Exception as ex:
-            eprint("[scraper] fallback feed links:", ex)
+            eprint("[scraper] feed scroll failed:", ex)
+            stop = "error"
+            break
+        rounds += 1
 
-    return targets[:max_businesses]
+    eprint(f"[scraper] feed targets: {len(targets)} after {rounds} scrolls (stop={stop})")
+    return [_card_metadata(t) for t in targets[:max_businesses]]
 
 
-def open_reviews_tab(driver, timeout: float = 10.0) -> bool:
-    xpath = (
-        "//button[@role='tab' and contains(@aria-label, 'Reviews')] | "
-        "//button[@role='tab' and contains(., 'Reviews')] | "
-        "//div[@role='tab' and contains(., 'Reviews')] | "
-        "//button[contains(@aria-label, 'reviews')]"
-    )
+REVIEW_SORT_LABELS = {
+    "relevant": "Most relevant",
+    "newest": "Newest",
+    "highest": "Highest rating",
+    "lowest": "Lowest rating",
+}
+
+
+def sort_reviews_panel(driver, order: str, timeout: float = 4.0, deadline: Optional[float] = None) -> bool:
+    """Switch the open reviews list to another sort order via the Sort menu.
+
+    Each wait is cut to what is left before `deadline` (a place's budget slice).
+    """
+    label = REVIEW_SORT_LABELS.get(order)
+    if not label:
+        return False
+    if deadline is not None and _over_budget(deadline):
+        return False
     try:
-        tab = WebDriverWait(driver, timeout).until(
-            EC.element_to_be_clickable((By.XPATH, xpath))
+        sort_btn = WebDriverWait(driver, _until(deadline, timeout)).until(
+            EC.element_to_be_clickable(
+                (By.XPATH, "//button[contains(@aria-label, 'Sort')] | //button[@data-value='Sort']")
+            )
+        )
+        sort_btn.click()
+        item = WebDriverWait(driver, _until(deadline, timeout)).until(
+            EC.element_to_be_clickable(
+                (By.XPATH, f"//div[@role='menuitemradio'][contains(., '{label}')]")
+            )
         )
-        tab.click()
-        time.sleep(1.5)
-        expand_reviews_list(driver)
-        wait_for_review_elements(driver, timeout=12.0)
-        scroll_reviews_panel(driver)
-        time.sleep(0.8)
+        item.click()
+        wait_for_dom(driver, _SELECTOR_ABSENT_JS, _until(deadline, 1.2), "div[role='menuitemradio']")
+        wait_for_review_elements(driver, timeout=_until(deadline, timeout))
+        return True
+    except Exception as ex:
+        eprint("[scraper] review sort failed:", order, ex)
+        return False
+
+
+def harvest_new_reviews(
+    driver,
+    known_ids: set,
+    limit: int,
+    business_name: str,
+    max_rounds: int = 30,
+    newest_first: bool = True,
+) -> List[dict]:
+    """Scroll a newest-first reviews list until a known review id (the watermark) shows up.
+
+    Returns the unseen rows above the watermark, newest first. With no watermark
+    yet it stops at `limit` rows, like a normal scrape. When the list could not be
+    sorted (`newest_first=False`) a stored id says nothing about what follows it,
+    so up to `limit` rows are read and every unseen one is returned, in list order.
+    """
+    rows: List[dict] = []
+    last_count = -1
+    watermark = known_ids if newest_first else set()
+    for _ in range(max_rounds + 1):
+        rows = extract_reviews_js(driver, 10_000, business_name)
+        ids = [r.get("review_id") for r in rows]
+        if any(rid in watermark for rid in ids if rid):
+            break
+        if not watermark and len(rows) >= limit:
+            break
+        if len(rows) == last_count:
+            break  # end of list, or Maps stopped loading
+        last_count = len(rows)
+        scroll_reviews_panel(driver, rounds=1)
+
+    if not newest_first:
+        return [r for r in rows if not (r.get("review_id") and r["review_id"] in known_ids)][:limit]
+    fresh: List[dict] = []
+    for row in rows:
+        rid = row.get("review_id")
+        if rid and rid in known_ids:
+            break
+        fresh.append(row)
+    return fresh if known_ids else fresh[:limit]
+
+
+REVIEWS_TAB_CANDIDATES = (
+    ("xpath", "//button[@role='tab' and contains(@aria-label, 'Reviews')]"),
+    ("xpath", "//button[@role='tab' and contains(., 'Reviews')]"),
+    ("xpath", "//div[@role='tab' and contains(., 'Reviews')]"),
+    ("xpath", "//button[contains(@aria-label, 'reviews')]"),
+)
+
+
+def open_reviews_tab(
+    driver,
+    timeout: Optional[float] = None,
+    scroll: bool = True,
+    expand: bool = True,
+    deadline: Optional[float] = None,
+) -> bool:
+    """Click the Reviews tab and wait for the list; every wait is cut to `deadline` when given."""
+    timeout, adaptive = resolve("reviews_tab", timeout)
+    if _until(deadline, timeout) < timeout:
+        # A miss on a wait cut short by the budget says nothing about the stage.
+        timeout, adaptive = _until(deadline, timeout), False
+    try:
+        started = time.monotonic()
+        hit = wait_for_first(driver, "reviews_tab", REVIEWS_TAB_CANDIDATES, timeout)
+        observe("reviews_tab", started, hit is not None, timeout, adaptive)
+        if not hit:
+            return False
+        hit["element"].click()
+        wait_for_dom(driver, _SELECTOR_PRESENT_JS, _until(deadline, 1.5), REVIEW_READY_CSS)
+        if expand:
+            expand_reviews_list(driver, deadline=deadline)
+        # After the tab click the cards are usually rendering already; keep the old 12 s ceiling.
+        wait_for_review_elements(driver, timeout=_until(deadline, min(12.0, timeout_for("review_cards"))))
+        if scroll:
+            scroll_reviews_panel(driver, deadline=deadline)
         return True
     except Exception:
         return False
 
 
+_REVIEWS_VIEW_JS = (
+    "(a) => !!document.querySelector(\"button[role='tab'][aria-selected='true'][aria-label*='eview']\") "
+    "&& !!document.querySelector(a[0])"
+)
+_reviews_entry: Dict[str, int] = {"deep_link": 0, "tab_click": 0, "failed": 0}
+_reviews_entry_lock = threading.Lock()
+
+
+def _count_reviews_entry(via: str) -> None:
+    with _reviews_entry_lock:
+        _reviews_entry[via] = _reviews_entry.get(via, 0) + 1
+
+
+def reviews_entry_counts() -> Dict[str, int]:
+    """How reviews lists were reached since startup: via deep link, tab click, or not at all."""
+    with _reviews_entry_lock:
+        return dict(_reviews_entry)
+
+
+def deep_links_enabled() -> bool:
+    return os.environ.get("REVIEWS_DEEP_LINK", "1") != "0"
+
+
+def enter_reviews_view(
+    driver,
+    deep_linked: bool,
+    timeout: Optional[float] = None,
+    scroll: bool = True,
+    expand: bool = True,
+    deadline: Optional[float] = None,
+) -> bool:
+    """Reviews list of the open place: already showing after a deep link, else via the tab click."""
+    view_timeout = _until(deadline, min(timeout if timeout is not None else timeout_for("reviews_tab"), 6.0))
+    if deep_linked and wait_for_dom(driver, _REVIEWS_VIEW_JS, view_timeout, REVIEW_READY_CSS):
+        _count_reviews_entry("deep_link")
+        if scroll:
+            scroll_reviews_panel(driver, deadline=deadline)
+        return True
+    if open_reviews_tab(driver, timeout=timeout, scroll=scroll, expand=expand, deadline=deadline):
+        _count_reviews_entry("tab_click")
+        return True
+    _count_reviews_entry("failed")
+    return False
+
+
 def extract_overview_reviews(driver, limit: int, business_name: str) -> List[dict]:
     """Some listings show review snippets on the Overview tab before Reviews is opened."""
     rows = extract_reviews_js(driver, limit, business_name)
@@ -473,57 +1130,111 @@ def extract_overview_reviews(driver, limit: int, business_name: str) -> List[dic
     return rows
 
 
-def extract_review_blocks(driver, reviews_per_business: int, target_name: str, min_stars: float, max_stars: float) -> List[dict]:
-    rows: List[dict] = []
-    review_elements: List[Any] = []
-    for css in REVIEW_BLOCK_SELECTORS:
-        review_elements = driver.find_elements(By.CSS_SELECTOR, css)
-        if review_elements:
-            eprint(f"[scraper] review blocks via {css}: {len(review_elements)}")
-            break
+REVIEW_CARDS_SCRIPT = """
+const blockSelectors = arguments[0];
+const maxCards = arguments[1];
+const textSelectors = ['span.wiI7pd', 'div.wiI7pd', 'div.MyEned span', "span[class*='wiI7pd']"];
+const starSelectors = ['span.kvMYJc', "span[role='img'][aria-label*='star']", "[aria-label*='stars']"];
+const authorSelectors = ['div.d4r55', 'button.al6Kxe div', "a[href*='/contrib/']"];
+const timeSelectors = ['span.rsqaWe', 'span.xRkPPb', 'span.dehysf'];
+
+function firstText(card, selectors) {
+  for (const sel of selectors) {
+    const el = card.querySelector(sel);
+    const t = el ? (el.innerText || '').trim() : '';
+    if (t) return t;
+  }
+  return '';
+}
+
+let cards = [];
+let via = null;
+for (const sel of blockSelectors) {
+  cards = document.querySelectorAll(sel);
+  if (cards.length) { via = sel; break; }
+}
+const out = [];
+for (const card of Array.from(cards).slice(0, maxCards)) {
+  const starLabels = [];
+  for (const sel of starSelectors) {
+    const el = card.querySelector(sel);
+    const label = el ? (el.getAttribute('aria-label') || '') : '';
+    if (label) starLabels.push(label);
+  }
+  let reviewId = card.getAttribute('data-review-id');
+  if (!reviewId) {
+    const idEl = card.querySelector('[data-review-id]');
+    if (idEl) reviewId = idEl.getAttribute('data-review-id');
+  }
+  out.push({
+    text: firstText(card, textSelectors),
+    star_labels: starLabels,
+    review_id: reviewId || null,
+    author: firstText(card, authorSelectors) || null,
+    relative_time: firstText(card, timeSelectors) || null,
+  });
+}
+return { via: via, total: cards.length, cards: out };
+"""
+
+
+def _read_review_cards(driver, max_cards: int) -> List[dict]:
+    started = time.monotonic()
+    try:
+        found = driver.execute_script(REVIEW_CARDS_SCRIPT, list(REVIEW_BLOCK_SELECTORS), max_cards) or {}
+    except Exception as ex:
+        eprint("[scraper] review card extraction failed:", ex)
+        found = {}
+    cards = found.get("cards") or []
+    if found.get("via"):
+        eprint(
+            f"[scraper] review blocks via {found['via']}: {found.get('total', len(cards))} "
+            f"(1 round trip, {(time.monotonic() - started) * 1000:.0f} ms)"
+        )
+    return cards
 
-    text_selectors = (
-        "span.wiI7pd",
-        "div.wiI7pd",
-        "div.MyEned span",
-        "span[class*='wiI7pd']",
-    )
-    star_selectors = ("span.kvMYJc", "span[role='img'][aria-label*='star']", "[aria-label*='stars']")
 
-    for el in review_elements[: reviews_per_business * 3]:
+def _card_stars(card: dict) -> Tuple[Optional[float], str]:
+    """(stars, aria label) of a card from REVIEW_CARDS_SCRIPT."""
+    star_aria = ""
+    for label in card.get("star_labels") or []:
+        star_aria = label
+        stars = _parse_star_value(label)
+        if stars is not None:
+            return stars, label
+    return None, star_aria
+
+
+def _rows_from_cards(
+    cards: List[dict], reviews_per_business: int, target_name: str, min_stars: float, max_stars: float
+) -> List[dict]:
+    rows: List[dict] = []
+    for card in cards:
         if len(rows) >= reviews_per_business:
             break
-        try:
-            text = ""
-            for span_sel in text_selectors:
-                try:
-                    text = el.find_element(By.CSS_SELECTOR, span_sel).text.strip()
-                    if text:
-                        break
-                except Exception:
-                    continue
-            if not text:
-                continue
-
-            stars: Optional[float] = None
-            star_aria = ""
-            for star_sel in star_selectors:
-                try:
-                    star_aria = el.find_element(By.CSS_SELECTOR, star_sel).get_attribute("aria-label") or ""
-                    if star_aria:
-                        stars = _parse_star_value(star_aria)
-                        if stars is not None:
-                            break
-                except Exception:
-                    continue
-
-            if stars is None:
-                rows.append({"business_name": target_name, "stars": star_aria or "unknown", "text": text})
-            elif min_stars <= stars <= max_stars:
-                rows.append({"business_name": target_name, "stars": star_aria, "text": text})
-        except Exception:
+        text = (card.get("text") or "").strip()
+        if not text:
             continue
 
+        stars, star_aria = _card_stars(card)
+        row = {
+            "business_name": target_name,
+            "stars": star_aria or "unknown",
+            "text": text,
+            "review_id": card.get("review_id"),
+            "author": card.get("author"),
+            "relative_time": card.get("relative_time"),
+        }
+        if stars is None or min_stars <= stars <= max_stars:
+            rows.append(row)
+    return rows
+
+
+def extract_review_blocks(driver, reviews_per_business: int, target_name: str, min_stars: float, max_stars: float) -> List[dict]:
+    """Read every review card in one `execute_script` call, then filter by star range in Python."""
+    cards = _read_review_cards(driver, reviews_per_business * 3)
+    rows = _rows_from_cards(cards, reviews_per_business, target_name, min_stars, max_stars)
+
     if not rows:
         js_rows = extract_reviews_js(driver, reviews_per_business, target_name)
         eprint("[scraper] JS fallback reviews:", len(js_rows))
@@ -537,10 +1248,416 @@ def extract_review_blocks(driver, reviews_per_business: int, target_name: str, m
     return rows[:reviews_per_business]
 
 
-def probe_place_reviews(search_query: str, location: Optional[str] = None) -> Dict[str, Any]:
+_DEEP_HARVEST_SCRIPT = """
+const blockSelectors = arguments[0];
+const keepCards = arguments[1];
+const reset = arguments[2];
+if (reset || !window.__leadgapSeen) window.__leadgapSeen = new Set();
+const seen = window.__leadgapSeen;
+const textSelectors = ['span.wiI7pd', 'div.wiI7pd', 'div.MyEned span', "span[class*='wiI7pd']"];
+const starSelectors = ['span.kvMYJc', "span[role='img'][aria-label*='star']", "[aria-label*='stars']"];
+const authorSelectors = ['div.d4r55', 'button.al6Kxe div', "a[href*='/contrib/']"];
+const timeSelectors = ['span.rsqaWe', 'span.xRkPPb', 'span.dehysf'];
+
+function firstText(card, selectors) {
+  for (const sel of selectors) {
+    const el = card.querySelector(sel);
+    const t = el ? (el.innerText || '').trim() : '';
+    if (t) return t;
+  }
+  return '';
+}
+function starLabel(card) {
+  for (const sel of starSelectors) {
+    const el = card.querySelector(sel);
+    const label = el ? (el.getAttribute('aria-label') || '') : '';
+    if (label) return label;
+  }
+  return '';
+}
+
+let cards = [];
+for (const sel of blockSelectors) {
+  cards = document.querySelectorAll(sel);
+  if (cards.length) break;
+}
+const rows = [];
+const captured = [];
+for (const card of cards) {
+  let reviewId = card.getAttribute('data-review-id');
+  if (!reviewId) {
+    const idEl = card.querySelector('[data-review-id]');
+    if (idEl) reviewId = idEl.getAttribute('data-review-id');
+  }
+  const text = firstText(card, textSelectors);
+  const key = reviewId || text;
+  if (!key) continue;  // not rendered yet; pick it up next round
+  captured.push(card);
+  if (seen.has(key)) continue;
+  seen.add(key);
+  rows.push({
+    text: text,
+    stars: starLabel(card) || 'unknown',
+    review_id: reviewId || null,
+    author: firstText(card, authorSelectors) || null,
+    relative_time: firstText(card, timeSelectors) || null,
+  });
+}
+// Detach captured cards but keep the tail, so the list still has something to scroll past.
+let pruned = 0;
+for (const card of captured.slice(0, Math.max(0, captured.length - keepCards))) {
+  card.remove();
+  pruned++;
+}
+const heap = performance.memory ? performance.memory.usedJSHeapSize : null;
+return { rows: rows, seen: seen.size, pruned: pruned, cards: cards.length, heap: heap };
+"""
+
+_AGE_UNITS_DAYS = {"minute": 1 / 1440, "hour": 1 / 24, "day": 1, "week": 7, "month": 30, "year": 365}
+
+
+def relative_age_days(text: Optional[str]) -> Optional[float]:
+    """Approximate age of Maps' "3 weeks ago" / "a year ago" / "Edited 2 days ago" labels."""
+    match = re.search(r"(\d+|an?)\s+(minute|hour|day|week|month|year)s?\s+ago", (text or "").lower())
+    if not match:
+        return None
+    count = 1 if match.group(1) in ("a", "an") else int(match.group(1))
+    return count * _AGE_UNITS_DAYS[match.group(2)]
+
+
+def _row_age_days(row: dict) -> Optional[float]:
+    published = row.get("published_at")
+    if published:
+        try:
+            return (datetime.now(timezone.utc) - datetime.fromisoformat(published)).total_seconds() / 86400
+        except ValueError:
+            pass
+    return relative_age_days(row.get("relative_time"))
+
+
+class DeepHarvest:
+    """Deep-mode settings for one scrape, plus per-place throughput for the report."""
+
+    def __init__(self, deadline: float, since_days: Optional[int] = None):
+        self.deadline = deadline
+        self.since_days = since_days
+        self.max_reviews = int(os.environ.get("DEEP_MAX_REVIEWS", "500"))
+        self.stall_rounds = int(os.environ.get("DEEP_STALL_ROUNDS", "3"))
+        self.keep_cards = int(os.environ.get("DEEP_KEEP_CARDS", "5"))
+        self.places: List[Dict[str, Any]] = []
+
+    def target(self, reviews_per_business: int) -> int:
+        return max(1, min(reviews_per_business, self.max_reviews))
+
+    def within_cutoff(self, row: dict) -> bool:
+        if not self.since_days:
+            return True
+        age = _row_age_days(row)
+        return age is None or age <= self.since_days
+
+    def summary(self) -> Dict[str, Any]:
+        reviews = sum(p["reviews"] for p in self.places)
+        seconds = sum(p["seconds"] for p in self.places)
+        return {
+            "reviews": reviews,
+            "seconds": round(seconds, 2),
+            "reviews_per_sec": round(reviews / seconds, 2) if seconds else None,
+            "places": list(self.places),
+        }
+
+
+def harvest_reviews_deep(
+    driver,
+    target: int,
+    target_name: str,
+    min_stars: float,
+    max_stars: float,
+    deep: DeepHarvest,
+    order: Optional[str] = None,
+    deadline: Optional[float] = None,
+    newest_first: bool = True,
+) -> Dict[str, Any]:
+    """Scroll the reviews list, extracting new cards each round and detaching the ones captured.
+
+    The DOM stays a few cards deep however many reviews are pulled, so renderer
+    memory and per-round extraction cost stay flat. Stops at `target` in-range
+    rows with text, the date cutoff, the first card past the star range of a
+    rating-sorted list (`order`), the end of the list, or the budget; the wait
+    per round grows while the list stalls and resets once it grows again.
+    `deadline` (a place's budget slice) stops it before the scrape's own deadline.
+    Rows older than the date cutoff never count toward `target`; the cutoff only
+    ends the harvest on a `newest_first` list, where nothing after it is newer.
+    """
+    rows: List[dict] = []
+    out = {"rows": rows, "stop": "no_panel", "pruned": 0, "peak_heap": 0}
+    panel = _reviews_panel(driver)
+    if panel is None:
+        return out
+    wait = 0.45
+    stalled = 0
+    first = True
+    stop_at = min(deep.deadline, deadline) if deadline is not None else deep.deadline
+    while True:
+        if _over_budget(stop_at):
+            out["stop"] = "budget"
+            return out
+        try:
+            found = driver.execute_script(
+                _DEEP_HARVEST_SCRIPT, list(REVIEW_BLOCK_SELECTORS), deep.keep_cards, first
+            ) or {}
+        except Exception as ex:
+            eprint("[scraper] deep harvest round failed:", ex)
+            out["stop"] = "error"
+            return out
+        first = False
+        out["pruned"] += found.get("pruned") or 0
+        out["peak_heap"] = max(out["peak_heap"], found.get("heap") or 0)
+
+        fresh = found.get("rows") or []
+        left_range = False
+        for card in fresh:
+            row = {"business_name": target_name, **card}
+            stars = _parse_star_value(str(row["stars"]))
+            left_range = left_range or _past_range(stars, order, min_stars, max_stars)
+            if row["text"] and (stars is None or min_stars <= stars <= max_stars) and deep.within_cutoff(row):
+                rows.append(row)
+        if len(rows) >= target:
+            out["stop"] = "target"
+            return out
+        if left_range:
+            out["stop"] = "left_range"
+            return out
+        if deep.since_days and newest_first and fresh:
+            age = relative_age_days(fresh[-1].get("relative_time"))
+            if age is not None and age > deep.since_days:
+                out["stop"] = "date_cutoff"
+                return out
+
+        if fresh:
+            stalled = 0
+            wait = 0.45
+        else:
+            stalled += 1
+            if stalled >= deep.stall_rounds:
+                out["stop"] = "end_of_list"
+                return out
+            wait = min(wait * 2, 3.0)
+        try:
+            scroll_and_wait(driver, panel, REVIEW_READY_CSS, wait)
+        except Exception:
+            out["stop"] = "error"
+            return out
+
+
+def _extract_deep(
+    driver,
+    tap: Optional[NetworkTap],
+    reviews_per_business: int,
+    target_name: str,
+    min_stars: float,
+    max_stars: float,
+    deep: DeepHarvest,
+    order: Optional[str] = None,
+    deadline: Optional[float] = None,
+) -> List[dict]:
+    started = time.monotonic()
+    target = deep.target(reviews_per_business)
+    # A date cutoff needs newest-first; otherwise put the star range first when it allows.
+    newest_first = True
+    if deep.since_days:
+        # Unsorted, an old review says nothing about the next one: filter by age, don't stop.
+        newest_first = sort_reviews_panel(driver, "newest", deadline=deadline)
+        order = None
+    elif order and not sort_reviews_panel(driver, order, deadline=deadline):
+        order = None
+    harvest = harvest_reviews_deep(
+        driver, target, target_name, min_stars, max_stars, deep, order, deadline, newest_first
+    )
+    rows = harvest["rows"]
+    if _network_backend(tap):
+        # Payload rows carry untruncated text; pruning the DOM does not affect them.
+        decoded = extract_reviews_network(driver, tap, target, target_name, min_stars, max_stars, max_rounds=0)
+        if decoded:
+            rows = decoded
+    rows = [r for r in rows if deep.within_cutoff(r)][:target]
+    seconds = time.monotonic() - started
+    deep.places.append({
+        "business_name": target_name,
+        "reviews": len(rows),
+        "seconds": round(seconds, 2),
+        "reviews_per_sec": round(len(rows) / seconds, 2) if seconds else None,
+        "stop": harvest["stop"],
+        "nodes_pruned": harvest["pruned"],
+        "peak_js_heap_mb": round(harvest["peak_heap"] / (1024 * 1024), 1) if harvest["peak_heap"] else None,
+    })
+    if not newest_first:
+        deep.places[-1]["sort_failed"] = True
+    eprint(f"[scraper] deep harvest {target_name}: {len(rows)} rows in {seconds:.1f}s (stop={harvest['stop']})")
+    return rows
+
+
+def range_sort_order(min_stars: float, max_stars: float) -> Optional[str]:
+    """Sort that puts the requested star range at the top of the list, if there is one."""
+    if os.environ.get("REVIEW_RANGE_SORT", "1") == "0":
+        return None
+    if min_stars <= 1 and max_stars < 5:
+        return "lowest"
+    if max_stars >= 5 and min_stars > 1:
+        return "highest"
+    return None
+
+
+def _past_range(stars: Optional[float], order: Optional[str], min_stars: float, max_stars: float) -> bool:
+    """On a rating-sorted list, whether this card (and so every card after it) is out of range."""
+    if stars is None:
+        return False
+    if order == "lowest":
+        return stars > max_stars
+    if order == "highest":
+        return stars < min_stars
+    return False
+
+
+def extract_sorted_reviews(
+    driver,
+    reviews_per_business: int,
+    target_name: str,
+    min_stars: float,
+    max_stars: float,
+    order: str,
+    max_rounds: int = 12,
+    deadline: Optional[float] = None,
+) -> Tuple[List[dict], str]:
+    """Scroll a rating-sorted list only while its cards are still inside the star range."""
+    panel = _reviews_panel(driver)
+    rows: List[dict] = []
+    last_total = -1
+    for round_no in range(max_rounds + 1):
+        cards = _read_review_cards(driver, 1000)
+        rows = _rows_from_cards(cards, reviews_per_business, target_name, min_stars, max_stars)
+        if len(rows) >= reviews_per_business:
+            return rows, "target"
+        if any(_past_range(_card_stars(c)[0], order, min_stars, max_stars) for c in cards):
+            return rows, "left_range"
+        if panel is None or len(cards) == last_total:
+            return rows, "end_of_list"
+        if round_no == max_rounds:
+            break
+        if deadline is not None and _over_budget(deadline):
+            return rows, "budget"
+        last_total = len(cards)
+        scroll_and_wait(driver, panel, REVIEW_READY_CSS, 0.45)
+    return rows, "max_rounds"
+
+
+def _network_backend(tap: Optional[NetworkTap]) -> bool:
+    return tap is not None and os.environ.get("REVIEW_EXTRACTION_BACKEND", "dom") == "network"
+
+
+def extract_reviews_network(
+    driver,
+    tap: NetworkTap,
+    reviews_per_business: int,
+    target_name: str,
+    min_stars: float,
+    max_stars: float,
+    max_rounds: int = 8,
+    deadline: Optional[float] = None,
+) -> List[dict]:
+    """Decode reviews from the list's XHR responses; scroll only to make Maps fetch the next page.
+
+    Review text in the payload is never truncated, so no "More" buttons need expanding.
+    """
+    rows: List[dict] = []
+    seen: set = set()
+    for round_no in range(max_rounds + 1):
+        added = 0
+        for body in tap.review_bodies():
+            for review in decode_review_payload(body):
+                if review["review_id"] in seen or not review["text"]:
+                    continue
+                seen.add(review["review_id"])
+                stars = _parse_star_value(review["stars"])
+                if stars is not None and not (min_stars <= stars <= max_stars):
+                    continue
+                rows.append({"business_name": target_name, **review})
+                added += 1
+        if len(rows) >= reviews_per_business or round_no == max_rounds:
+            break
+        if round_no and not added:
+            break  # end of list, or the payload layout changed
+        if deadline is not None and _over_budget(deadline):
+            break
+        scroll_reviews_panel(driver, rounds=1)
+    return rows[:reviews_per_business]
+
+
+def _prescroll(tap: Optional[NetworkTap], deep: Optional[DeepHarvest], min_stars: float, max_stars: float) -> bool:
+    """Whether opening the reviews list should do the fixed scroll rounds up front.
+
+    Deep, network and rating-sorted extraction scroll on their own terms.
+    """
+    return deep is None and not _network_backend(tap) and range_sort_order(min_stars, max_stars) is None
+
+
+def _extract_place_reviews(
+    driver,
+    tap: Optional[NetworkTap],
+    reviews_per_business: int,
+    target_name: str,
+    min_stars: float,
+    max_stars: float,
+    deep: Optional[DeepHarvest] = None,
+    deadline: Optional[float] = None,
+) -> List[dict]:
+    """Rows for the open reviews list, sorted so the star range comes first when it allows.
+
+    REVIEW_EXTRACTION_BACKEND=network decodes XHR payloads; the DOM path is the fallback.
+    Scrolling stops at `deadline` (the place's budget slice) when one is given.
+    """
+    order = range_sort_order(min_stars, max_stars)
+    if deep is not None:
+        return _extract_deep(
+            driver, tap, reviews_per_business, target_name, min_stars, max_stars, deep, order, deadline
+        )
+    sorted_list = False
+    if order:
+        if _network_backend(tap):
+            tap.review_bodies()  # drop the pages fetched in the default order
+        sorted_list = sort_reviews_panel(driver, order, deadline=deadline)
+        if sorted_list:
+            if _network_backend(tap):
+                rows = extract_reviews_network(
+                    driver, tap, reviews_per_business, target_name, min_stars, max_stars, deadline=deadline
+                )
+                if rows:
+                    return rows
+            rows, stop = extract_sorted_reviews(
+                driver, reviews_per_business, target_name, min_stars, max_stars, order,
+                max_rounds=int(os.environ.get("SORTED_MAX_SCROLL_ROUNDS", "12")),
+                deadline=deadline,
+            )
+            eprint(f"[scraper] {order}-first rows for {target_name}: {len(rows)} (stop={stop})")
+            if rows:
+                return rows
+    if _network_backend(tap):
+        rows = extract_reviews_network(
+            driver, tap, reviews_per_business, target_name, min_stars, max_stars, deadline=deadline
+        )
+        if rows:
+            eprint("[scraper] review rows via network for", target_name, ":", len(rows))
+            return rows
+        eprint("[scraper] no decodable review payload for", target_name, "— using DOM")
+    if order and not sorted_list:
+        # _prescroll skipped the up-front scroll rounds expecting a sorted list; do them now.
+        eprint("[scraper] sort failed for", target_name, "— scrolling the default order")
+        scroll_reviews_panel(driver, deadline=deadline)
+    return extract_review_blocks(driver, reviews_per_business, target_name, min_stars, max_stars)
+
+
+def probe_place_reviews(search_query: str, location: Optional[str] = None, driver=None) -> Dict[str, Any]:
     """Open first search result and report review DOM state."""
-    driver = get_driver()
-    try:
+    with _driver_session(driver) as driver:
         if not load_search_results(driver, search_query, location):
             return {"ok": False, "stage": "search_load_failed"}
 
@@ -561,7 +1678,9 @@ def probe_place_reviews(search_query: str, location: Optional[str] = None) -> Di
         for css in REVIEW_BLOCK_SELECTORS + ("span.wiI7pd", "div.wiI7pd", "div.MyEned", "div.g88MCb"):
             block_counts[css] = len(driver.find_elements(By.CSS_SELECTOR, css))
 
+        extract_started = time.monotonic()
         sample_rows = extract_review_blocks(driver, 3, place_name or "unknown", 1.0, 5.0)
+        extract_ms = round((time.monotonic() - extract_started) * 1000, 1)
         if not sample_rows and overview_rows:
             sample_rows = overview_rows
 
@@ -592,20 +1711,18 @@ def probe_place_reviews(search_query: str, location: Optional[str] = None) -> Di
             "block_counts": block_counts,
             "overview_reviews": overview_rows,
             "sample_reviews": sample_rows,
+            "extract_ms": extract_ms,
             "text_hit_count": text_hit_count,
         }
-    finally:
-        driver.quit()
 
 
-def probe_maps_search(search_query: str, location: Optional[str] = None) -> Dict[str, Any]:
+def probe_maps_search(search_query: str, location: Optional[str] = None, driver=None) -> Dict[str, Any]:
     """Lightweight probe for debugging empty scrapes (no review extraction)."""
-    driver = get_driver()
-    try:
+    with _driver_session(driver) as driver:
         url = _maps_search_url(search_query, location)
         driver.get(url)
         dismiss_cookie_consent(driver)
-        time.sleep(2.0)
+        wait_for_dom(driver, _SELECTOR_PRESENT_JS, 2.0, "div[role='feed'], div[role='article'], h1.DUwDvf")
 
         blocked = _page_block_reason(driver)
         feed_count = len(driver.find_elements(By.CSS_SELECTOR, "div[role='feed']"))
@@ -623,8 +1740,265 @@ def probe_maps_search(search_query: str, location: Optional[str] = None) -> Dict
             "place_link_count": len(place_links),
             "targets": targets,
         }
+
+
+def _scrape_open_place(
+    driver,
+    place_name: str,
+    reviews_per_business: int,
+    min_stars: float,
+    max_stars: float,
+    on_rows: Optional[RowsCallback],
+    tap: Optional[NetworkTap] = None,
+    deep: Optional[DeepHarvest] = None,
+) -> List[dict]:
+    """Overview snippets, then the Reviews tab, for the place shown in the current tab."""
+    out: List[dict] = []
+    overview_rows = extract_overview_reviews(driver, reviews_per_business, place_name)
+    if overview_rows:
+        out.extend(overview_rows)
+        _emit_rows(on_rows, place_name, overview_rows)
+        eprint("[scraper] overview reviews for", place_name, ":", len(overview_rows))
+    if len(overview_rows) >= reviews_per_business:
+        return out
+
+    if not enter_reviews_view(driver, False, scroll=_prescroll(tap, deep, min_stars, max_stars)):
+        eprint("[scraper] reviews tab not found for:", place_name)
+        return out
+    rows = _extract_place_reviews(driver, tap, reviews_per_business, place_name, min_stars, max_stars, deep)
+    eprint("[scraper] extracted rows for", place_name, ":", len(rows))
+    out.extend(rows)
+    _emit_rows(on_rows, place_name, rows)
+    return out
+
+
+_KICK_REVIEWS_TAB_SCRIPT = """
+const tab = document.querySelector(
+  "button[role='tab'][aria-label*='Reviews'], button[role='tab'][aria-label*='reviews']"
+);
+if (!tab) return false;
+tab.click();
+return true;
+"""
+
+
+def _create_tab(driver) -> Optional[str]:
+    """New about:blank tab in the current tab's browser context; its target id is the window handle.
+
+    Other jobs open tabs in the same Chromium in context mode, so the tab is
+    created by id rather than picked out of `window_handles`.
+    """
+    try:
+        info = driver.execute_cdp_cmd("Target.getTargetInfo", {}).get("targetInfo") or {}
+        params = {"url": "about:blank"}
+        if info.get("browserContextId"):
+            params["browserContextId"] = info["browserContextId"]
+        return driver.execute_cdp_cmd("Target.createTarget", params).get("targetId")
+    except Exception as ex:
+        eprint("[scraper] Target.createTarget failed:", ex)
+        return None
+
+
+def _window_open_tab(driver, opener: str) -> Optional[str]:
+    """Fallback: window.open, then confirm the new tab's opener, since any job may have opened one."""
+    before = set(driver.window_handles)
+    driver.execute_script("window.open('about:blank', '_blank');")
+    new_handles = [h for h in driver.window_handles if h not in before]
+    try:
+        infos = driver.execute_cdp_cmd("Target.getTargets", {}).get("targetInfos", [])
+    except Exception as ex:
+        eprint("[scraper] tab opener lookup failed:", ex)
+        return None
+    for info in infos:
+        if info.get("openerId") == opener and info.get("targetId") in new_handles:
+            return info["targetId"]
+    return None
+
+
+def _open_tab(driver, url: str, tap: Optional[NetworkTap] = None) -> Optional[str]:
+    """Open `url` in a new tab from the current one and return its handle.
+
+    The tab starts on about:blank so the request blocklist is in place before
+    the real navigation, which is started over CDP so nothing waits for it.
+    """
+    opener = driver.current_window_handle
+    handle = _create_tab(driver) or _window_open_tab(driver, opener)
+    if not handle:
+        return None
+    if tap is not None:
+        tap.watch(handle)
+    try:
+        driver.switch_to.window(handle)
+        apply_network_policy(driver)
+        driver.execute_cdp_cmd("Page.navigate", {"url": url})
     finally:
-        driver.quit()
+        driver.switch_to.window(opener)
+    return handle
+
+
+def _scrape_targets_in_tabs(
+    driver,
+    targets: List[Dict[str, str]],
+    reviews_per_business: int,
+    min_stars: float,
+    max_stars: float,
+    deadline: float,
+    on_rows: Optional[RowsCallback],
+    tap: Optional[NetworkTap] = None,
+    deep: Optional[DeepHarvest] = None,
+    scheduler: Optional[BudgetScheduler] = None,
+) -> List[dict]:
+    """Load every target in its own tab at once, then work the tabs in turn.
+
+    Page loads and review-list loads overlap across tabs, so a batch costs about
+    as much as its slowest place instead of the sum of all of them. Each place
+    gets a slice of the remaining budget from `scheduler`.
+    """
+    out: List[dict] = []
+    origin = driver.current_window_handle
+    batch_size = max(1, int(os.environ.get("NICHE_TAB_CONCURRENCY", "5")))
+    scheduler = scheduler or BudgetScheduler(deadline, targets)
+
+    for start in range(0, len(targets), batch_size):
+        if _over_budget(deadline):
+            eprint("[scraper] budget exhausted — returning partial niche results")
+            break
+        batch = targets[start:start + batch_size]
+
+        # Navigations are fired without waiting, so every new tab loads in parallel.
+        # Deep links land on the reviews list itself, saving the tab click and its waits.
+        tabs: List[Any] = []
+        for target in batch:
+            direct = reviews_url(target["link"]) if deep_links_enabled() else None
+            handle = _open_tab(driver, direct or target["link"], tap)
+            if handle:
+                tabs.append((handle, target, direct is not None))
+            else:
+                scheduler.done(target["link"], target["name"], 0)
+
+        # Pass 1: per tab, read overview snippets and kick off the Reviews tab.
+        # Places whose slice is already tight skip the overview snippets.
+        pending: List[Any] = []
+        for handle, target, deep_linked in tabs:
+            if _over_budget(deadline):
+                break
+            key = target["link"]
+            started = time.monotonic()
+            place_name = target["name"]
+            finished: Optional[int] = None  # rows, once the place needs no second pass
+            try:
+                driver.switch_to.window(handle)
+                panel_timeout = min(12.0, max(1.0, scheduler.slice_for(key)))
+                place_name = wait_for_place_panel(driver, timeout=panel_timeout) or target["name"]
+                if deep_linked:
+                    pending.append((handle, key, place_name, True, 0))
+                    continue
+                overview_rows: List[dict] = []
+                if scheduler.tight(key):
+                    scheduler.skip(key, "overview")
+                else:
+                    overview_rows = extract_overview_reviews(driver, reviews_per_business, place_name)
+                if overview_rows:
+                    out.extend(overview_rows)
+                    _emit_rows(on_rows, place_name, overview_rows)
+                if len(overview_rows) < reviews_per_business:
+                    driver.execute_script(_KICK_REVIEWS_TAB_SCRIPT)
+                    pending.append((handle, key, place_name, False, len(overview_rows)))
+                else:
+                    finished = len(overview_rows)
+            except Exception as ex:
+                eprint("[scraper] tab open error:", target.get("name"), ex)
+                finished = 0
+            finally:
+                scheduler.charge(key, started)
+            if finished is not None:
+                scheduler.done(key, place_name, finished)
+
+        # Pass 2: the review lists have been loading in the background meanwhile.
+        for handle, key, place_name, deep_linked, overview_count in pending:
+            if _over_budget(deadline):
+                eprint("[scraper] budget exhausted — returning partial niche results")
+                break
+            started = time.monotonic()
+            rows: List[dict] = []
+            try:
+                driver.switch_to.window(handle)
+                slice_sec = scheduler.grant(key)
+                place_deadline = started + slice_sec
+                tight = slice_sec < scheduler.tight_slice
+                if tight and not deep_linked:
+                    scheduler.skip(key, "expand_reviews")
+                scroll = _prescroll(tap, deep, min_stars, max_stars)
+                entered = enter_reviews_view(
+                    driver, deep_linked, scroll=scroll, expand=not tight, deadline=place_deadline
+                )
+                if not entered:
+                    eprint("[scraper] reviews tab not found for:", place_name)
+                    continue
+                rows = _extract_place_reviews(
+                    driver, tap, reviews_per_business, place_name, min_stars, max_stars, deep, place_deadline
+                )
+                eprint(f"[scraper] extracted rows for {place_name}: {len(rows)} (slice {slice_sec:.1f}s)")
+                out.extend(rows)
+                _emit_rows(on_rows, place_name, rows)
+            except Exception as ex:
+                eprint("[scraper] business loop error:", place_name, ex)
+            finally:
+                scheduler.charge(key, started)
+                scheduler.done(key, place_name, overview_count + len(rows))
+
+        for handle, _target, _deep_linked in tabs:
+            try:
+                driver.switch_to.window(handle)
+                driver.close()
+            except Exception:
+                pass
+        driver.switch_to.window(origin)
+
+    return out
+
+
+def _scrape_by_index(
+    driver,
+    search_query: str,
+    location: Optional[str],
+    max_businesses: int,
+    reviews_per_business: int,
+    min_stars: float,
+    max_stars: float,
+    deadline: float,
+    on_rows: Optional[RowsCallback],
+    tap: Optional[NetworkTap] = None,
+    deep: Optional[DeepHarvest] = None,
+) -> List[dict]:
+    """Fallback when result cards expose no place links: click cards one by one."""
+    out: List[dict] = []
+    for index in range(max_businesses):
+        if _over_budget(deadline):
+            eprint("[scraper] budget exhausted — returning partial niche results")
+            break
+
+        if index > 0:
+            if not load_search_results(driver, search_query, location):
+                break
+            scroll_results_feed(driver)
+
+        clicked_name = open_place_by_index(driver, index)
+        if not clicked_name:
+            eprint("[scraper] could not open listing at index", index)
+            break
+
+        place_name = wait_for_place_panel(driver) or clicked_name
+        try:
+            out.extend(
+                _scrape_open_place(
+                    driver, place_name, reviews_per_business, min_stars, max_stars, on_rows, tap, deep
+                )
+            )
+        except Exception as ex:
+            eprint("[scraper] business loop error:", place_name, ex)
+            continue
+    return out
 
 
 def scrape_all_business_reviews(
@@ -634,69 +2008,254 @@ def scrape_all_business_reviews(
     reviews_per_business: int = 10,
     min_stars: int = 1,
     max_stars: int = 5,
+    driver=None,
+    budget_sec: Optional[float] = None,
+    on_rows: Optional[RowsCallback] = None,
+    report: Optional[Dict[str, Any]] = None,
+    deep: bool = False,
+    since_days: Optional[int] = None,
 ) -> List[dict]:
-    driver = get_driver()
+    """Reviews from the first `max_businesses` places for a niche search.
+
+    Capped at 20 rows; with `deep` each place is scrolled for up to
+    `reviews_per_business` (at most DEEP_MAX_REVIEWS) and the cap is lifted.
+    """
     all_reviews_data: List[dict] = []
-    deadline = _scrape_budget_deadline()
+    deadline = _scrape_budget_deadline(budget_sec)
     ms = float(min_stars)
     xs = float(max_stars)
+    harvest = DeepHarvest(deadline, since_days) if deep else None
+    on_rows = _filtered_rows(on_rows, None if harvest is not None else 20)
 
-    try:
+    with _driver_session(driver) as driver, _scrape_report(driver, report) as tap:
         if not load_search_results(driver, search_query, location):
             return []
 
         if "/maps/place/" in driver.current_url:
             place_name = wait_for_place_panel(driver) or "unknown"
-            overview_rows = extract_overview_reviews(driver, reviews_per_business, place_name)
-            if overview_rows:
-                all_reviews_data.extend(overview_rows)
-            if len(overview_rows) < reviews_per_business and open_reviews_tab(driver, timeout=12.0):
-                rows = extract_review_blocks(driver, reviews_per_business, place_name, ms, xs)
-                eprint("[scraper] extracted rows for", place_name, ":", len(rows))
-                all_reviews_data.extend(rows)
+            all_reviews_data.extend(
+                _scrape_open_place(driver, place_name, reviews_per_business, ms, xs, on_rows, tap, harvest)
+            )
         else:
-            for index in range(max_businesses):
-                if _over_budget(deadline):
-                    eprint("[scraper] budget exhausted — returning partial niche results")
-                    break
-
-                if index > 0:
-                    if not load_search_results(driver, search_query, location):
-                        break
-                    scroll_results_feed(driver)
-
-                clicked_name = open_place_by_index(driver, index)
-                if not clicked_name:
-                    eprint("[scraper] could not open listing at index", index)
-                    break
-
-                place_name = wait_for_place_panel(driver) or clicked_name
-                try:
-                    overview_rows = extract_overview_reviews(driver, reviews_per_business, place_name)
-                    if overview_rows:
-                        all_reviews_data.extend(overview_rows)
-                        eprint("[scraper] overview reviews for", place_name, ":", len(overview_rows))
-                    if len(overview_rows) >= reviews_per_business:
-                        continue
-
-                    if not open_reviews_tab(driver, timeout=12.0):
-                        eprint("[scraper] reviews tab not found for:", place_name)
-                        continue
-                    time.sleep(0.6)
-                    rows = extract_review_blocks(
-                        driver, reviews_per_business, place_name, ms, xs
+            # Resolve every target from one results page instead of reloading it per business,
+            # then spend the navigations on the places most likely to have in-range reviews.
+            candidates = collect_place_targets(driver, candidate_pool_size(max_businesses))
+            targets = rank_targets(
+                candidates, max_businesses, reviews_per_business, ms, xs,
+                full_scan=harvest is not None or range_sort_order(ms, xs) is not None,
+            )
+            if report is not None:
+                report["targets"] = [
+                    {k: t.get(k) for k in ("name", "rating", "review_count", "expected_yield")} for t in targets
+                ]
+                report["candidates"] = len(candidates)
+            if targets:
+                scheduler = BudgetScheduler(deadline, targets)
+                all_reviews_data.extend(
+                    _scrape_targets_in_tabs(
+                        driver, targets, reviews_per_business, ms, xs, deadline, on_rows, tap, harvest, scheduler
                     )
-                    eprint("[scraper] extracted rows for", place_name, ":", len(rows))
-                    all_reviews_data.extend(rows)
-                except Exception as ex:
-                    eprint("[scraper] business loop error:", place_name, ex)
-                    continue
+                )
+                if report is not None:
+                    report["budget"] = scheduler.summary()
+            else:
+                all_reviews_data.extend(
+                    _scrape_by_index(
+                        driver, search_query, location, max_businesses,
+                        reviews_per_business, ms, xs, deadline, on_rows, tap, harvest,
+                    )
+                )
 
-        out = filter_reviews(all_reviews_data)[:20]
+        out = filter_reviews(all_reviews_data)
+        if harvest is None:
+            out = out[:20]
+        elif report is not None:
+            report["deep"] = harvest.summary()
         eprint("[scraper] niche complete, review count:", len(out))
         return out
-    finally:
-        driver.quit()
+
+
+_PLACE_SUMMARY_SCRIPT = """
+const h1 = document.querySelector('h1.DUwDvf, h1');
+const summary = document.querySelector('div.F7nice');
+const ratingEl = summary ? summary.querySelector("span[aria-hidden='true']") : null;
+const countEl = summary ? summary.querySelector("span[aria-label*='review' i]") : null;
+const categoryEl = document.querySelector('button.DkEaL');
+const histogram = {};
+// Star histogram rows: aria-label like "5 stars, 1,234 reviews".
+for (const row of document.querySelectorAll("div[role='main'] tr[aria-label]")) {
+  const m = (row.getAttribute('aria-label') || '').match(/(\\d)\\s*stars?,\\s*([\\d.,]+)/i);
+  if (m) histogram[m[1]] = m[2];
+}
+return {
+  name: h1 ? (h1.innerText || '').trim() : '',
+  rating_text: ratingEl ? ratingEl.innerText : '',
+  count_text: countEl ? (countEl.getAttribute('aria-label') || countEl.innerText || '') : '',
+  category: categoryEl ? (categoryEl.innerText || '').trim() : '',
+  histogram: histogram,
+};
+"""
+
+
+def coords_from_url(url: str) -> Optional[Dict[str, float]]:
+    """Place coordinates from a Maps URL (`!3d..!4d..`, else the `@lat,lng` viewport)."""
+    match = re.search(r"!3d(-?\d+(?:\.\d+)?)!4d(-?\d+(?:\.\d+)?)", url or "")
+    if not match:
+        match = re.search(r"@(-?\d+(?:\.\d+)?),(-?\d+(?:\.\d+)?)", url or "")
+    if not match:
+        return None
+    return {"lat": float(match.group(1)), "lng": float(match.group(2))}
+
+
+def _census_row(target: Dict[str, Any]) -> Dict[str, Any]:
+    coords = coords_from_url(target["link"]) or {}
+    return {
+        "name": target["name"],
+        "url": target["link"],
+        "place_key": place_key_from_url(target["link"]),
+        "rating": target.get("rating"),
+        "review_count": target.get("review_count"),
+        "category": target.get("category"),
+        "lat": coords.get("lat"),
+        "lng": coords.get("lng"),
+        "histogram": None,
+    }
+
+
+def read_place_summary(driver) -> Dict[str, Any]:
+    """Rating, review count, category and star histogram of the open place panel."""
+    try:
+        raw = driver.execute_script(_PLACE_SUMMARY_SCRIPT) or {}
+    except Exception as ex:
+        eprint("[scraper] place summary failed:", ex)
+        return {}
+    histogram = {int(k): _parse_count(v) for k, v in (raw.get("histogram") or {}).items()}
+    return {
+        "name": raw.get("name") or "",
+        "rating": _parse_star_value(raw.get("rating_text") or ""),
+        "review_count": _parse_count(raw.get("count_text") or ""),
+        "category": raw.get("category") or None,
+        "histogram": histogram or None,
+    }
+
+
+def _fill_histograms(driver, rows: List[Dict[str, Any]], deadline: float, tap: Optional[NetworkTap]) -> None:
+    """Open places in parallel tabs (panel only, no reviews) to read their star histograms."""
+    origin = driver.current_window_handle
+    batch_size = max(1, int(os.environ.get("NICHE_TAB_CONCURRENCY", "5")))
+    for start in range(0, len(rows), batch_size):
+        if _over_budget(deadline):
+            eprint("[scraper] budget exhausted — census histograms incomplete")
+            break
+        tabs = []
+        for row in rows[start:start + batch_size]:
+            handle = _open_tab(driver, row["url"], tap)
+            if handle:
+                tabs.append((handle, row))
+        for handle, row in tabs:
+            try:
+                driver.switch_to.window(handle)
+                if not _over_budget(deadline):
+                    wait_for_place_panel(driver, timeout=min(12.0, max(1.0, deadline - time.monotonic())))
+                    wait_for_dom(driver, _SELECTOR_PRESENT_JS, 2.0, "div[role='main'] tr[aria-label]")
+                    summary = read_place_summary(driver)
+                    row["histogram"] = summary.get("histogram")
+                    for key in ("rating", "review_count", "category"):
+                        if row.get(key) is None and summary.get(key) is not None:
+                            row[key] = summary[key]
+                driver.close()
+            except Exception as ex:
+                eprint("[scraper] census histogram error:", row.get("name"), ex)
+        driver.switch_to.window(origin)
+
+
+def scrape_market_census(
+    search_query: str,
+    location: Optional[str] = None,
+    max_businesses: int = 60,
+    driver=None,
+    budget_sec: Optional[float] = None,
+    on_rows: Optional[RowsCallback] = None,
+    report: Optional[Dict[str, Any]] = None,
+    histograms: int = 0,
+) -> List[dict]:
+    """One row per listing in the results feed, read from the cards without opening places.
+
+    Rows: name, url, place_key, rating, review_count, category, lat, lng, histogram.
+    The histogram needs the place panel, so only the first `histograms` places
+    are opened for it (in parallel tabs); the rest keep `histogram: None`.
+    """
+    deadline = _scrape_budget_deadline(budget_sec)
+    with _driver_session(driver) as driver, _scrape_report(driver, report) as tap:
+        if not load_search_results(driver, search_query, location):
+            return []
+
+        if "/maps/place/" in driver.current_url:
+            # A single match opens straight into its place panel.
+            wait_for_place_panel(driver)
+            summary = read_place_summary(driver)
+            name = summary.get("name") or place_name_from_url(driver.current_url)
+            row = _census_row({**summary, "name": name, "link": driver.current_url})
+            row["histogram"] = summary.get("histogram")
+            rows = [row]
+        else:
+            rows = [_census_row(t) for t in collect_place_targets(driver, max_businesses)]
+            if histograms > 0 and rows:
+                _fill_histograms(driver, rows[:histograms], deadline, tap)
+
+        _emit_rows(on_rows, search_query, rows)
+        eprint("[scraper] census complete, places:", len(rows))
+        return rows
+
+
+def _in_star_range(row: dict, min_stars: float, max_stars: float) -> bool:
+    stars = _parse_star_value(str(row.get("stars", "")))
+    return stars is None or min_stars <= stars <= max_stars
+
+
+def _incremental_competitor_reviews(
+    driver,
+    review_store,
+    biz_info: Dict[str, str],
+    search_query: str,
+    reviews_per_business: int,
+    min_stars: float,
+    max_stars: float,
+    on_rows: Optional[RowsCallback],
+) -> Dict[str, Any]:
+    place_key = place_key_from_url(driver.current_url) or search_query.lower()
+    known_ids = review_store.known_ids(place_key)
+    newest_first = sort_reviews_panel(driver, "newest")
+    # Store every star rating so the watermark holds when the requested range changes.
+    fresh = harvest_new_reviews(
+        driver,
+        known_ids,
+        reviews_per_business,
+        biz_info["name"],
+        max_rounds=int(os.environ.get("INCREMENTAL_MAX_SCROLL_ROUNDS", "30")),
+        newest_first=newest_first,
+    )
+    if newest_first:
+        history = review_store.merge(place_key, biz_info["name"], fresh)
+    else:
+        # Unsorted rows may be old reviews; storing them as first seen now would break
+        # the newest-first history, so they are reported but not merged.
+        eprint(f"[scraper] incremental {place_key}: newest sort failed — not updating the store")
+        history = review_store.merge(place_key, biz_info["name"], [])
+    new_rows = [r for r in fresh if _in_star_range(r, min_stars, max_stars)]
+    _emit_rows(on_rows, biz_info["name"], new_rows)
+    eprint(f"[scraper] incremental {place_key}: {len(fresh)} new, {len(history)} stored")
+
+    merged = [r for r in history if _in_star_range(r, min_stars, max_stars)]
+    out = {
+        "business_info": biz_info,
+        "place_key": place_key,
+        "new_reviews": new_rows,
+        "reviews": filter_reviews(merged)[:20],
+    }
+    if not newest_first:
+        out["sort_failed"] = True
+    return out
 
 
 def scrape_competitor_reviews(
@@ -705,10 +2264,25 @@ def scrape_competitor_reviews(
     reviews_per_business: int = 20,
     min_stars: int = 1,
     max_stars: int = 5,
+    driver=None,
+    budget_sec: Optional[float] = None,
+    on_rows: Optional[RowsCallback] = None,
+    review_store=None,
+    report: Optional[Dict[str, Any]] = None,
+    deep: bool = False,
+    since_days: Optional[int] = None,
 ) -> Dict[str, Any]:
-    driver = get_driver()
-    deadline = _scrape_budget_deadline()
-    try:
+    """Scrape one named competitor.
+
+    With a `review_store` the scrape is incremental: the list is sorted newest
+    first and scrolling stops at the first review id already stored for the place.
+    With `deep` the list is scrolled for up to `reviews_per_business` reviews
+    (at most DEEP_MAX_REVIEWS, optionally only the last `since_days`) and the
+    20-review cap is lifted.
+    """
+    deadline = _scrape_budget_deadline(budget_sec)
+    harvest = DeepHarvest(deadline, since_days) if deep and review_store is None else None
+    with _driver_session(driver) as driver, _scrape_report(driver, report) as tap:
         search_query = f"{competitor_name} {location}".strip()
         if not load_search_results(driver, search_query, None):
             return {"business_info": {"name": competitor_name, "website": "N/A", "phone": "N/A", "address": "N/A"}, "reviews": []}
@@ -720,7 +2294,7 @@ def scrape_competitor_reviews(
                 scroll_results_feed(driver, rounds=3)
                 if not open_place_by_index(driver, 0):
                     raise TimeoutException("no listing to click")
-                time.sleep(1.0)
+                wait_for_dom(driver, _PLACE_OPENED_JS, 1.0)
             except Exception as ex:
                 eprint("[scraper] competitor first-result click failed:", ex)
 
@@ -735,14 +2309,22 @@ def scrape_competitor_reviews(
         except Exception:
             pass
 
-        if not open_reviews_tab(driver, timeout=6.0):
+        ms = float(min_stars)
+        xs = float(max_stars)
+        scroll = review_store is None and _prescroll(tap, harvest, ms, xs)
+        if not enter_reviews_view(driver, False, timeout=6.0, scroll=scroll):
             eprint("[scraper] competitor reviews tab missing")
             return {"business_info": biz_info, "reviews": []}
 
-        ms = float(min_stars)
-        xs = float(max_stars)
-        rows = extract_review_blocks(driver, reviews_per_business, biz_info["name"], ms, xs)
+        if review_store is not None:
+            return _incremental_competitor_reviews(
+                driver, review_store, biz_info, search_query, reviews_per_business, ms, xs, on_rows
+            )
+        rows = _extract_place_reviews(driver, tap, reviews_per_business, biz_info["name"], ms, xs, harvest)
+        _emit_rows(_filtered_rows(on_rows, None if harvest is not None else 20), biz_info["name"], rows)
 
+        if harvest is not None:
+            if report is not None:
+                report["deep"] = harvest.summary()
+            return {"business_info": biz_info, "reviews": filter_reviews(rows)}
         return {"business_info": biz_info, "reviews": filter_reviews(rows)[:20]}  # hard cap: at most 20 reviews per scrape job
-    finally:
-        driver.quit()
@@ -0,0 +1,138 @@
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+# stage -> (default, floor) in seconds. The default (the old fixed timeout) is
+# also the ceiling: learning only ever shortens a wait. In-page stages are further
+# capped just below SCRIPT_TIMEOUT_SEC (see `_bounds`).
+STAGE_BOUNDS: Dict[str, Tuple[float, float]] = {
+    "page_load": (float(os.environ.get("PAGE_LOAD_TIMEOUT_SEC", "45")), 8.0),
+    "results_feed": (15.0, 4.0),
+    "reviews_tab": (12.0, 3.0),
+    "review_cards": (18.0, 3.0),
+}
+
+# Stages that wait inside execute_async_script, which the driver's script timeout cuts off.
+_IN_PAGE_STAGES = ("results_feed", "reviews_tab", "review_cards")
+
+# Latencies of successful waits only; a miss is censored and says nothing about the latency.
+_samples: Dict[str, Deque[float]] = {}
+# Recent outcomes (True = miss) for the miss rate.
+_outcomes: Dict[str, Deque[bool]] = {}
+_misses: Dict[str, int] = {}
+_lock = threading.Lock()
+
+
+def script_wait_ceiling() -> float:
+    """Longest in-page wait that still ends before the driver's script timeout (SCRIPT_TIMEOUT_SEC)."""
+    return max(1.0, float(os.environ.get("SCRIPT_TIMEOUT_SEC", "20")) - 1.0)
+
+
+def _bounds(stage: str) -> Tuple[float, float]:
+    default, floor = STAGE_BOUNDS[stage]
+    if stage in _IN_PAGE_STAGES:
+        default = min(default, script_wait_ceiling())
+        floor = min(floor, default)
+    return default, floor
+
+
+def _enabled() -> bool:
+    return os.environ.get("ADAPTIVE_TIMEOUTS", "1") != "0"
+
+
+def _window() -> int:
+    return max(1, int(os.environ.get("STAGE_TIMEOUT_WINDOW", "50")))
+
+
+def _percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    rank = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[rank]
+
+
+def _miss_rate(stage: str) -> float:
+    outcomes = _outcomes.get(stage)
+    return sum(outcomes) / len(outcomes) if outcomes else 0.0
+
+
+def _learned(stage: str) -> Optional[float]:
+    samples = _samples.get(stage)
+    if not samples or len(samples) < int(os.environ.get("STAGE_TIMEOUT_MIN_SAMPLES", "10")):
+        return None
+    # Many misses mean the learned value is too short for current conditions.
+    if _miss_rate(stage) > float(os.environ.get("STAGE_TIMEOUT_MAX_MISS_RATE", "0.2")):
+        return None
+    pct = float(os.environ.get("STAGE_TIMEOUT_PERCENTILE", "95"))
+    return _percentile(samples, pct) * float(os.environ.get("STAGE_TIMEOUT_MARGIN", "1.5"))
+
+
+def timeout_for(stage: str) -> float:
+    """Current timeout for a stage: percentile of recent successful latencies × margin.
+
+    Clamped between the stage's floor and its default; the default also applies
+    until enough samples exist or while the recent miss rate is too high.
+    """
+    default, floor = _bounds(stage)
+    if not _enabled():
+        return default
+    with _lock:
+        learned = _learned(stage)
+    if learned is None:
+        return default
+    return min(default, max(floor, learned))
+
+
+def resolve(stage: str, timeout: Optional[float]) -> Tuple[float, bool]:
+    """(timeout, adaptive): an explicit timeout wins; None means use the stage's learned value."""
+    if timeout is not None:
+        return timeout, False
+    return timeout_for(stage), True
+
+
+def observe(stage: str, started: float, ok: bool, timeout: float, adaptive: bool = True) -> None:
+    """Record the outcome of a stage (`started` is a time.monotonic() value).
+
+    Successes add their latency. A miss only counts toward the miss rate, and
+    only when the stage ran on its adaptive value; a shorter explicit timeout
+    says nothing about the stage.
+    """
+    if not ok and not adaptive:
+        return
+    with _lock:
+        window = _window()
+        samples = _samples.get(stage)
+        if samples is None or samples.maxlen != window:
+            samples = _samples[stage] = deque(samples or (), maxlen=window)
+        outcomes = _outcomes.get(stage)
+        if outcomes is None or outcomes.maxlen != window:
+            outcomes = _outcomes[stage] = deque(outcomes or (), maxlen=window)
+        outcomes.append(not ok)
+        if ok:
+            samples.append(time.monotonic() - started)
+        else:
+            _misses[stage] = _misses.get(stage, 0) + 1
+
+
+def stage_timeouts() -> Dict[str, Any]:
+    """Per stage: the timeout in use, its bounds, and the latency samples behind it."""
+    out: Dict[str, Any] = {}
+    for stage in STAGE_BOUNDS:
+        default, floor = _bounds(stage)
+        current = timeout_for(stage)
+        with _lock:
+            samples = list(_samples.get(stage, ()))
+            misses = _misses.get(stage, 0)
+            miss_rate = _miss_rate(stage)
+        out[stage] = {
+            "timeout_sec": round(current, 2),
+            "default_sec": default,
+            "bounds_sec": [floor, default],
+            "samples": len(samples),
+            "misses": misses,
+            "recent_miss_rate": round(miss_rate, 3),
+            "p50_sec": round(_percentile(samples, 50), 2) if samples else None,
+            "p95_sec": round(_percentile(samples, 95), 2) if samples else None,
+        }
+    return out
@@ -0,0 +1,70 @@
+import os
+from typing import Any, Dict, List, Optional
+
+# Share of reviews spread evenly over 2-4 stars; the rest sits at 1 and 5 stars.
+# Review ratings are J-shaped, so a place's average mostly tells how the 1/5 split falls.
+_MIDDLE_SHARE = 0.15
+# Fraction of reviews that carry text (rating-only reviews yield no rows).
+_TEXT_SHARE = float(os.environ.get("RANK_TEXT_SHARE", "0.6"))
+# Used for cards that show no rating / review count.
+_PRIOR_RATING = 4.3
+_PRIOR_COUNT = 20
+
+
+def star_shares(rating: Optional[float]) -> Dict[int, float]:
+    """Estimated share of 1..5-star reviews for a place with this average rating."""
+    r = _PRIOR_RATING if rating is None else min(5.0, max(1.0, rating))
+    edge = 1.0 - _MIDDLE_SHARE
+    # Solve p1 + p5 = edge and 1*p1 + 5*p5 + 3*middle = r for p1.
+    p1 = (edge * 5 + 3 * _MIDDLE_SHARE - r) / 4
+    p1 = min(edge, max(0.0, p1))
+    middle = _MIDDLE_SHARE / 3
+    return {1: p1, 2: middle, 3: middle, 4: middle, 5: edge - p1}
+
+
+def in_range_share(rating: Optional[float], min_stars: float, max_stars: float) -> float:
+    return sum(p for stars, p in star_shares(rating).items() if min_stars <= stars <= max_stars)
+
+
+def expected_yield(
+    target: Dict[str, Any],
+    reviews_per_business: int,
+    min_stars: float,
+    max_stars: float,
+    scan_depth: Optional[int],
+) -> float:
+    """Expected in-range rows with text from one place, given how many reviews get scanned."""
+    count = target.get("review_count")
+    count = _PRIOR_COUNT if count is None else count
+    scanned = count if scan_depth is None else min(count, scan_depth)
+    rows = scanned * _TEXT_SHARE * in_range_share(target.get("rating"), min_stars, max_stars)
+    return min(float(reviews_per_business), rows)
+
+
+def rank_targets(
+    candidates: List[Dict[str, Any]],
+    max_businesses: int,
+    reviews_per_business: int,
+    min_stars: float,
+    max_stars: float,
+    full_scan: bool = False,
+) -> List[Dict[str, Any]]:
+    """Pick the `max_businesses` candidates with the highest expected yield, best first.
+
+    A default-ordered scrape only reads the first screens of a reviews list
+    (RANK_SCAN_DEPTH reviews). With `full_scan` (deep mode, or a list sorted so the
+    star range comes first) every in-range review is reachable. Ties keep feed order.
+    """
+    scan_depth = None if full_scan else int(os.environ.get("RANK_SCAN_DEPTH", "50"))
+    scored = []
+    for index, target in enumerate(candidates):
+        value = expected_yield(target, reviews_per_business, min_stars, max_stars, scan_depth)
+        scored.append((-value, index, dict(target, expected_yield=round(value, 2))))
+    scored.sort(key=lambda item: (item[0], item[1]))
+    return [target for _value, _index, target in scored[:max_businesses]]
+
+
+def candidate_pool_size(max_businesses: int) -> int:
+    """How many feed cards to rank for `max_businesses` picks (RANK_CANDIDATE_FACTOR, 1 = off)."""
+    factor = max(1.0, float(os.environ.get("RANK_CANDIDATE_FACTOR", "3")))
+    return max(max_businesses, int(round(max_businesses * factor)))
@@ -0,0 +1,23 @@
+from result_cache import canonical_query
+
+
+def test_equivalent_spellings_share_a_key():
+    assert canonical_query("Plumbers in  Austin, TX") == canonical_query("plumber", "Austin TX")
+    assert canonical_query("plumbers near austin") == canonical_query("Plumber in Austin")
+
+
+def test_plural_folding_does_not_merge_distinct_niches():
+    assert canonical_query("glasses", "Austin") != canonical_query("glass", "Austin")
+    assert canonical_query("dresses in Dallas") != canonical_query("dress in Dallas")
+    assert canonical_query("news NY") != canonical_query("new NY")
+
+
+def test_location_and_brand_tokens_are_not_folded():
+    assert canonical_query("bakery", "Des Moines") == "bakery des moines"
+    assert canonical_query("pizza in Kansas City") == "pizza kansas city"
+
+
+def test_connectors_are_only_dropped_between_niche_and_place():
+    assert canonical_query("in-n-out LA") == "in-n-out la"
+    assert canonical_query("inn", "Aspen") == "inn aspen"
+    assert canonical_query("around the clock plumbing", "Reno") == "around the clock plumbing reno"